@@ -816,6 +816,20 @@ class AlphaBot:
             self._hourly_pnl = 0.0
             self._hourly_wins = 0
             self._hourly_losses = 0
+
+            # Per-pair scalp stats for the window — also resets each strategy's hourly counters
+            for scalp in self._scalp_strategies.values():
+                stats = scalp.reset_hourly_stats()
+                if stats["trades"] == 0 and stats["skipped"] == 0:
+                    continue
+                logger.info(
+                    "Scalp window [%s]: %dW/%dL pnl=$%.4f (mean=$%.4f sd=$%.4f) skipped=%d | "
+                    "day: %d trades pnl=$%.4f sd=$%.4f | max streak W%d/L%d",
+                    stats["pair"], stats["wins"], stats["losses"], stats["pnl"],
+                    stats["pnl_mean"], stats["pnl_variance"] ** 0.5, stats["skipped"],
+                    stats["day_trades"], stats["day_pnl"], stats["day_pnl_variance"] ** 0.5,
+                    stats["max_win_streak"], stats["max_loss_streak"],
+                )
         except Exception:
             logger.exception("Error sending hourly report")
 
@@ -0,0 +1,110 @@
+"""Multi-pair REST fetcher — coalesces per-pair market data requests.
+
+Every scalp pair on an exchange polls its own candles and spread ticker.
+When several pairs ask at the same moment, those are N independent request
+chains, each waiting on the shared ccxt rate limiter in turn.
+
+Architecture:
+- One MultiPairFetcher per exchange session, shared by every pair on it
+- A pair's request joins the batch for that kind (OHLCV limit / ticker) if
+  another pair's request is already pending, otherwise it opens one
+- A batch is sent on the next event-loop pass — requests never wait on a
+  timer, only pairs asking in the same pass are coalesced
+- OHLCV fans out concurrently via TradeExecutor.batch_fetch_ohlcv
+- Tickers go out as ONE fetch_tickers call where the exchange supports it
+- Per-pair errors are raised to that pair's caller only
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+from alpha.utils import setup_logger
+
+if TYPE_CHECKING:
+    from alpha.trade_executor import TradeExecutor
+
+logger = setup_logger("pair_fetcher")
+
+# Batch kinds — an OHLCV batch is also keyed by its candle limit
+_KIND_OHLCV = "ohlcv"
+_KIND_TICKER = "ticker"
+
+
+class MultiPairFetcher:
+    """Shared per-exchange fetcher that batches concurrent per-pair requests."""
+
+    # id(exchange) -> fetcher, so every strategy on a session shares one
+    _shared: dict[int, MultiPairFetcher] = {}
+
+    def __init__(self, executor: TradeExecutor, exchange: Any) -> None:
+        self.executor = executor
+        self.exchange = exchange
+        # Pending batches: key -> pair -> futures waiting on that pair's result
+        self._batches: dict[tuple[str, int], dict[str, list[asyncio.Future[Any]]]] = {}
+        self._send_tasks: set[asyncio.Task[None]] = set()  # strong refs until done
+
+    @classmethod
+    def shared(cls, executor: TradeExecutor, exchange: Any) -> MultiPairFetcher:
+        """Return the fetcher for this exchange session, creating it on first use."""
+        fetcher = cls._shared.get(id(exchange))
+        if fetcher is None or fetcher.exchange is not exchange:
+            fetcher = cls(executor, exchange)
+            cls._shared[id(exchange)] = fetcher
+        return fetcher
+
+    async def fetch_ohlcv(self, pair: str, limit: int) -> list:
+        """1m OHLCV rows for a pair, fetched alongside any other pairs asking now."""
+        return await self._request((_KIND_OHLCV, limit), pair)
+
+    async def fetch_ticker(self, pair: str) -> dict:
+        """Ticker for a pair, fetched in one call with any other pairs asking now."""
+        return await self._request((_KIND_TICKER, 0), pair)
+
+    async def _request(self, key: tuple[str, int], pair: str) -> Any:
+        loop = asyncio.get_running_loop()
+        waiters = self._batches.get(key)
+        if waiters is None:
+            waiters = {}
+            self._batches[key] = waiters
+            loop.call_soon(self._flush, key)
+        future: asyncio.Future[Any] = loop.create_future()
+        waiters.setdefault(pair, []).append(future)
+        return await future
+
+    def _flush(self, key: tuple[str, int]) -> None:
+        """Close the batch for this key and send its request in the background."""
+        waiters = self._batches.pop(key, None)
+        if not waiters:
+            return
+        task = asyncio.get_running_loop().create_task(self._send(key, waiters))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+
+    async def _send(self, key: tuple[str, int], waiters: dict[str, list[asyncio.Future[Any]]]) -> None:
+        kind, limit = key
+        pairs = list(waiters)
+        try:
+            if kind == _KIND_OHLCV:
+                results = await self.executor.batch_fetch_ohlcv(
+                    pairs, "1m", limit, exchange=self.exchange,
+                )
+            else:
+                results = await self.executor.batch_fetch_tickers(pairs, exchange=self.exchange)
+        except Exception as e:
+            results = {pair: e for pair in pairs}
+        if len(pairs) > 1:
+            logger.debug("Batched %s for %d pairs: %s", kind, len(pairs), ", ".join(pairs))
+
+        for pair, futures in waiters.items():
+            result = results.get(pair)
+            if result is None:
+                result = LookupError(f"no {kind} returned for {pair}")
+            for future in futures:
+                if future.done():
+                    continue  # caller was cancelled
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
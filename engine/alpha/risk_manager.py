@@ -59,6 +59,8 @@ class RiskManager:
         self.delta_capital: float = 0.0
 
         self.open_positions: list[Position] = []
+        # Open positions per strategy name — kept in step with open_positions
+        self._strategy_counts: dict[str, int] = {}
         self.daily_pnl: float = 0.0
         self.daily_pnl_scalp: float = 0.0
         self.daily_pnl_options: float = 0.0
@@ -115,6 +117,10 @@ class RiskManager:
         """Count open positions on a specific exchange."""
         return sum(1 for p in self.open_positions if p.exchange == exchange_id)
 
+    def strategy_position_count(self, strategy: str) -> int:
+        """Count open positions opened by a strategy — O(1), no scan."""
+        return self._strategy_counts.get(strategy, 0)
+
     # Per-exchange position limits
     MAX_POSITIONS_PER_EXCHANGE = 3  # match scalp MAX_POSITIONS
 
@@ -325,12 +331,14 @@ class RiskManager:
 
     def record_open(self, signal: Signal) -> None:
         """Track a newly opened position."""
+        strategy = signal.strategy.value
+        self._strategy_counts[strategy] = self._strategy_counts.get(strategy, 0) + 1
         self.open_positions.append(Position(
             pair=signal.pair,
             side=signal.side,
             entry_price=signal.price,
             amount=signal.amount,
-            strategy=signal.strategy.value,
+            strategy=strategy,
             opened_at=utcnow().isoformat(),
             exchange=signal.exchange_id,
             leverage=signal.leverage,
@@ -352,6 +360,7 @@ class RiskManager:
         for p in self.open_positions:
             if p.pair == pair and not removed:
                 removed = True
+                self._strategy_counts[p.strategy] -= 1
                 continue
             new_positions.append(p)
         self.open_positions = new_positions
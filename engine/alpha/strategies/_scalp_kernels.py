@@ -0,0 +1,460 @@
+"""Numba-compiled indicator kernels for the scalp strategy.
+
+The kernels work on the raw 1m candle arrays and return only the latest
+scalar values. The scalp tick never needs the full indicator series, so
+this skips the pandas Series / ``ta`` wrapper allocations.
+
+Indicator definitions match ``ta`` (RSIIndicator, BollingerBands,
+KeltnerChannel with original_version=False, AverageTrueRange) and pandas
+``ewm(adjust=False)``. The recursive ones (RSI, EMA, ATR) are carried across
+ticks in an IndicatorState instead of being re-seeded on every fetched
+window, the way a charting platform keeps them.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import boolean, float64, int64, njit, types, void
+
+# Column indexes of the ccxt OHLCV rows once converted to a float64 ndarray
+COL_TS = 0
+COL_OPEN = 1
+COL_HIGH = 2
+COL_LOW = 3
+COL_CLOSE = 4
+COL_VOLUME = 5
+
+_BAR_MS = 60_000  # 1m candles
+
+# Explicit signatures compile the kernels eagerly at import (or load them from
+# the on-disk cache) instead of on the first scalp tick. Everything stays
+# float64: the candle timestamps need ~41 bits and the running BB
+# sum / sum-of-squares cancels catastrophically in float32 at BTC prices.
+_F64_1D = float64[:]
+_FEATURES = types.UniTuple(float64, 11)
+
+# IndicatorState.values layout — everything here covers closed candles only
+_S_BARS = 0        # closed candles folded into the recursive indicators
+_S_PREV_CLOSE = 1
+_S_AVG_GAIN = 2    # RSI(14) Wilder averages
+_S_AVG_LOSS = 3
+_S_EMA_9 = 4
+_S_EMA_20 = 5      # Keltner center
+_S_EMA_21 = 6
+_S_ATR_10 = 7      # Keltner band width
+_S_TR_SUM_10 = 8   # ATR seed (mean of the first n true ranges)
+_S_ATR_14 = 9      # dynamic SL/TP
+_S_TR_SUM_14 = 10
+_S_BB_SUM = 11     # closed part of the 20-candle BB window
+_S_BB_SUM_SQ = 12
+_S_BB_N = 13
+_S_VOL_SUM = 14    # up to 10 closed candles before the current one
+_S_VOL_N = 15
+_S_TPV_SUM = 16    # VWAP sums over the closed part of the fetched window
+_S_V_SUM = 17
+_S_DROP_TPV = 18   # first row of the window, dropped on the next slide
+_S_DROP_V = 19
+_S_LEN = 20
+
+# EMA smoothing factors, alpha = 2 / (span + 1) — pandas ewm(span, adjust=False)
+_A_EMA_9 = 2.0 / 10.0
+_A_EMA_20 = 2.0 / 21.0
+_A_EMA_21 = 2.0 / 22.0
+
+
+@njit(inline="always", fastmath=True)
+def _ema_step(prev: float, x: float, alpha: float) -> float:
+    """One EMA update, e + alpha * (x - e) — a single fused multiply-add."""
+    return prev + alpha * (x - prev)
+
+
+@njit(void(_F64_1D, float64, float64, float64), cache=True, fastmath=True)
+def _fold_bar(state: np.ndarray, h: float, lo: float, c: float) -> None:
+    """Fold one closed candle into the recursive indicators (RSI, EMA, ATR)."""
+    bars = state[_S_BARS]
+    if bars == 0.0:
+        state[_S_EMA_9] = c
+        state[_S_EMA_20] = c
+        state[_S_EMA_21] = c
+        tr = h - lo  # first candle has no previous close
+    else:
+        pc = state[_S_PREV_CLOSE]
+        diff = c - pc
+        gain = diff if diff > 0.0 else 0.0
+        loss = -diff if diff < 0.0 else 0.0
+        state[_S_AVG_GAIN] += (gain - state[_S_AVG_GAIN]) / 14.0
+        state[_S_AVG_LOSS] += (loss - state[_S_AVG_LOSS]) / 14.0
+        state[_S_EMA_9] = _ema_step(state[_S_EMA_9], c, _A_EMA_9)
+        state[_S_EMA_20] = _ema_step(state[_S_EMA_20], c, _A_EMA_20)
+        state[_S_EMA_21] = _ema_step(state[_S_EMA_21], c, _A_EMA_21)
+        tr = h - lo
+        up = abs(h - pc)
+        dn = abs(lo - pc)
+        if up > tr:
+            tr = up
+        if dn > tr:
+            tr = dn
+
+    if bars < 10.0:
+        state[_S_TR_SUM_10] += tr
+        if bars == 9.0:
+            state[_S_ATR_10] = state[_S_TR_SUM_10] / 10.0
+    else:
+        state[_S_ATR_10] = (state[_S_ATR_10] * 9.0 + tr) / 10.0
+    if bars < 14.0:
+        state[_S_TR_SUM_14] += tr
+        if bars == 13.0:
+            state[_S_ATR_14] = state[_S_TR_SUM_14] / 14.0
+    else:
+        state[_S_ATR_14] = (state[_S_ATR_14] * 13.0 + tr) / 14.0
+
+    state[_S_PREV_CLOSE] = c
+    state[_S_BARS] = bars + 1.0
+
+
+@njit(_F64_1D(_F64_1D, _F64_1D, _F64_1D, _F64_1D), cache=True, fastmath=True)
+def state_seed(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+) -> np.ndarray:
+    """Build a fresh state from every closed candle (all but the last row)."""
+    state = np.zeros(_S_LEN)
+    closed = close.shape[0] - 1
+    for i in range(closed):
+        _fold_bar(state, high[i], low[i], close[i])
+
+    start = closed - 19 if closed > 19 else 0
+    for i in range(start, closed):
+        state[_S_BB_SUM] += close[i]
+        state[_S_BB_SUM_SQ] += close[i] * close[i]
+    state[_S_BB_N] = closed - start
+
+    start = closed - 10 if closed > 10 else 0
+    for i in range(start, closed):
+        state[_S_VOL_SUM] += volume[i]
+    state[_S_VOL_N] = closed - start
+
+    for i in range(closed):
+        state[_S_TPV_SUM] += (high[i] + low[i] + close[i]) / 3.0 * volume[i]
+        state[_S_V_SUM] += volume[i]
+    state[_S_DROP_TPV] = (high[0] + low[0] + close[0]) / 3.0 * volume[0]
+    state[_S_DROP_V] = volume[0]
+    return state
+
+
+@njit(void(_F64_1D, _F64_1D, _F64_1D, _F64_1D, _F64_1D), cache=True, fastmath=True)
+def state_slide(
+    state: np.ndarray,
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+) -> None:
+    """Advance the state in place by exactly one newly closed candle — O(1).
+
+    The window must be the same length as last time and hold at least
+    21 candles, so the rows leaving the BB and volume windows are still in it.
+    """
+    size = close.shape[0]
+    j = size - 2  # the candle that just closed
+    c = close[j]
+    v = volume[j]
+    _fold_bar(state, high[j], low[j], c)
+
+    old = close[size - 21]
+    state[_S_BB_SUM] += c - old
+    state[_S_BB_SUM_SQ] += c * c - old * old
+    state[_S_VOL_SUM] += v - volume[size - 12]
+
+    state[_S_TPV_SUM] += (high[j] + low[j] + c) / 3.0 * v - state[_S_DROP_TPV]
+    state[_S_V_SUM] += v - state[_S_DROP_V]
+    state[_S_DROP_TPV] = (high[0] + low[0] + close[0]) / 3.0 * volume[0]
+    state[_S_DROP_V] = volume[0]
+
+
+@njit(_FEATURES(_F64_1D, float64, float64, float64, float64), cache=True, fastmath=True)
+def state_features(
+    state: np.ndarray,
+    h: float,
+    lo: float,
+    c: float,
+    v: float,
+) -> tuple[float, float, float, float, float, float, float, float, float, float, float]:
+    """Latest indicator values with the forming candle applied — O(1).
+
+    Returns (rsi, bb_upper, bb_lower, bb_mid, kc_upper, kc_lower,
+    ema_9, ema_21, avg_vol, vwap, atr_14).
+
+    - RSI(14): 50.0 when fewer than 14 candles
+    - BB(20, 2): population std, over every candle when fewer than 20
+    - KC(20, ATR10, 1.5): EMA20 center ± 1.5 x ATR10, 0.0 when fewer than 10
+    - avg_vol: mean of the 10 candles before the current one
+    - VWAP: over the fetched window, 0.0 when there is no volume
+    - ATR(14): 0.0 when fewer than 15 candles
+    """
+    bars = state[_S_BARS]
+    if bars == 0.0:
+        ema_9 = c
+        ema_20 = c
+        ema_21 = c
+        avg_gain = 0.0
+        avg_loss = 0.0
+        tr = h - lo
+    else:
+        pc = state[_S_PREV_CLOSE]
+        diff = c - pc
+        gain = diff if diff > 0.0 else 0.0
+        loss = -diff if diff < 0.0 else 0.0
+        avg_gain = state[_S_AVG_GAIN] + (gain - state[_S_AVG_GAIN]) / 14.0
+        avg_loss = state[_S_AVG_LOSS] + (loss - state[_S_AVG_LOSS]) / 14.0
+        ema_9 = _ema_step(state[_S_EMA_9], c, _A_EMA_9)
+        ema_20 = _ema_step(state[_S_EMA_20], c, _A_EMA_20)
+        ema_21 = _ema_step(state[_S_EMA_21], c, _A_EMA_21)
+        tr = h - lo
+        up = abs(h - pc)
+        dn = abs(lo - pc)
+        if up > tr:
+            tr = up
+        if dn > tr:
+            tr = dn
+
+    if bars + 1.0 < 14.0:
+        rsi = 50.0
+    elif avg_loss == 0.0:
+        rsi = 100.0
+    else:
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    bb_n = state[_S_BB_N] + 1.0
+    bb_mid = (state[_S_BB_SUM] + c) / bb_n
+    var = (state[_S_BB_SUM_SQ] + c * c) / bb_n - bb_mid * bb_mid
+    std = np.sqrt(var) if var > 0.0 else 0.0
+
+    if bars < 9.0:
+        kc_upper = 0.0
+        kc_lower = 0.0
+    else:
+        if bars == 9.0:
+            atr_10 = (state[_S_TR_SUM_10] + tr) / 10.0
+        else:
+            atr_10 = (state[_S_ATR_10] * 9.0 + tr) / 10.0
+        kc_upper = ema_20 + 1.5 * atr_10
+        kc_lower = ema_20 - 1.5 * atr_10
+
+    if state[_S_VOL_N] >= 10.0:
+        avg_vol = state[_S_VOL_SUM] / 10.0
+    else:
+        avg_vol = (state[_S_VOL_SUM] + v) / (state[_S_VOL_N] + 1.0)
+
+    v_sum = state[_S_V_SUM] + v
+    vwap = (state[_S_TPV_SUM] + (h + lo + c) / 3.0 * v) / v_sum if v_sum > 0.0 else 0.0
+
+    if bars < 14.0:
+        atr_14 = 0.0
+    else:
+        atr_14 = (state[_S_ATR_14] * 13.0 + tr) / 14.0
+
+    return (
+        rsi, bb_mid + 2.0 * std, bb_mid - 2.0 * std, bb_mid,
+        kc_upper, kc_lower, ema_9, ema_21, avg_vol, vwap, atr_14,
+    )
+
+
+class IndicatorState:
+    """Closed-candle indicator state for one pair, carried across scalp ticks.
+
+    A new 1m candle only closes once a minute, so most ticks see the same
+    history. ``update()`` slides the state by one candle when a bar closes,
+    re-seeds it from the window on any gap, and otherwise only applies the
+    forming candle on top.
+    """
+
+    __slots__ = ("bar_ts", "size", "values")
+
+    def __init__(self) -> None:
+        self.bar_ts: int = -1  # open time (ms) of the forming candle
+        self.size: int = 0
+        self.values: np.ndarray = np.zeros(_S_LEN)
+
+    def update(
+        self, candles: np.ndarray,
+    ) -> tuple[float, float, float, float, float, float, float, float, float, float, float]:
+        """Align to a freshly fetched OHLCV window and return state_features()."""
+        high = candles[:, COL_HIGH]
+        low = candles[:, COL_LOW]
+        close = candles[:, COL_CLOSE]
+        volume = candles[:, COL_VOLUME]
+        size = len(candles)
+        bar_ts = int(candles[-1, COL_TS])
+        if bar_ts != self.bar_ts:
+            if bar_ts - self.bar_ts == _BAR_MS and size == self.size and size >= 21:
+                state_slide(self.values, high, low, close, volume)
+            else:
+                self.values = state_seed(high, low, close, volume)
+            self.bar_ts = bar_ts
+            self.size = size
+        return state_features(self.values, high[-1], low[-1], close[-1], volume[-1])
+
+
+# Entry signal bits — lowest bit first, in the order the signals are listed
+# in ScalpStrategy._detect_quality_entry (the first set bit leads the reason)
+SIG_MOM = 1 << 0
+SIG_VOL = 1 << 1
+SIG_RSI = 1 << 2
+SIG_BB = 1 << 3
+SIG_MOM5M = 1 << 4
+SIG_TCONT = 1 << 5
+SIG_VWAP = 1 << 6
+SIG_BBSQZ = 1 << 7
+SIG_FVG = 1 << 8
+SIG_VOLDIV = 1 << 9
+
+
+@njit(
+    types.Tuple((int64, int64, float64, float64, float64))(
+        _F64_1D, _F64_1D, _F64_1D, _F64_1D,
+        float64, float64, float64, float64, float64,
+        float64, float64, float64, float64, float64, boolean,
+        float64, float64, float64, float64,
+        float64, float64, float64, int64, float64, boolean,
+    ),
+    cache=True,
+)
+def signal_masks(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    price: float,
+    momentum_60s: float,
+    momentum_300s: float,
+    vol_ratio: float,
+    rsi_now: float,
+    bb_upper: float,
+    bb_lower: float,
+    vwap: float,
+    ema_9: float,
+    ema_21: float,
+    squeeze_active: bool,
+    eff_mom: float,
+    eff_vol: float,
+    eff_rsi_l: float,
+    eff_rsi_s: float,
+    bb_revert_lower: float,
+    bb_revert_upper: float,
+    mom_5m_min: float,
+    tcont_candles: int,
+    tcont_vol_ratio: float,
+    can_short: bool,
+) -> tuple[int, int, float, float, float]:
+    """Evaluate every entry signal as integer bits — no string work.
+
+    Returns (bull_mask, bear_mask, tcont_vol_x, fvg_gap_pct, voldiv_drop_pct);
+    the three floats are only meaningful when the matching bit is set and
+    exist so the caller can format the reason afterwards.
+    """
+    bull = 0
+    bear = 0
+    tcont_vol_x = 0.0
+    fvg_gap_pct = 0.0
+    voldiv_drop_pct = 0.0
+    size = close.shape[0]
+
+    # Signals 1-5, 7 and 8 are plain threshold compares — OR-ed in as
+    # bit * condition so there are no data-dependent jumps on the common path.
+
+    # 1. Momentum (60s)
+    mom_bull = momentum_60s >= eff_mom
+    mom_bear = momentum_60s <= -eff_mom
+    bull |= SIG_MOM * mom_bull
+    bear |= SIG_MOM * mom_bear
+
+    # 2. Volume spike — direction from candle, flat candle counts for both
+    vol_spike = vol_ratio >= eff_vol
+    bull |= SIG_VOL * (vol_spike & (momentum_60s >= 0.0))
+    bear |= SIG_VOL * (vol_spike & (momentum_60s <= 0.0))
+
+    # 3. RSI extreme
+    bull |= SIG_RSI * (rsi_now < eff_rsi_l)
+    bear |= SIG_RSI * (rsi_now > eff_rsi_s)
+
+    # 4. BB mean-reversion
+    bb_range = bb_upper - bb_lower if bb_upper > bb_lower else 1.0
+    bb_position = (price - bb_lower) / bb_range
+    bull |= SIG_BB * (bb_position <= bb_revert_lower)
+    bear |= SIG_BB * ((bb_position >= bb_revert_upper) & can_short)
+
+    # 5. 5m momentum — only when the 60s momentum did not already fire
+    bull |= SIG_MOM5M * ((momentum_300s >= mom_5m_min) & (not mom_bull))
+    bear |= SIG_MOM5M * ((momentum_300s <= -mom_5m_min) & (not mom_bear))
+
+    # 6. Trend continuation: new N-candle low/high + volume above average
+    #    One sweep over the lookback for the low, high and volume sum.
+    if size >= tcont_candles + 1:
+        lo = np.inf
+        hi = -np.inf
+        vol_sum = 0.0
+        for i in range(size - tcont_candles - 1, size - 1):
+            c = close[i]
+            lo = min(lo, c)
+            hi = max(hi, c)
+            vol_sum += volume[i]
+        avg_vol = vol_sum / tcont_candles
+        current_close = close[size - 1]
+        current_vol = volume[size - 1]
+        if current_vol >= avg_vol * tcont_vol_ratio:
+            tcont_vol_x = current_vol / avg_vol if avg_vol > 0.0 else 0.0
+            if current_close < lo and can_short:
+                bear |= SIG_TCONT
+            if current_close > hi:
+                bull |= SIG_TCONT
+
+    # 7. VWAP + EMA ribbon
+    ribbon_ready = (vwap > 0.0) & (ema_9 > 0.0) & (ema_21 > 0.0)
+    bull |= SIG_VWAP * (ribbon_ready & (price > vwap) & (ema_9 > ema_21))
+    bear |= SIG_VWAP * (ribbon_ready & (price < vwap) & (ema_9 < ema_21) & can_short)
+
+    # 8. Bollinger squeeze breakout
+    squeeze_vol = squeeze_active & vol_spike
+    bull |= SIG_BBSQZ * (squeeze_vol & (price > bb_upper))
+    bear |= SIG_BBSQZ * (squeeze_vol & (price < bb_lower) & can_short)
+
+    # 10. Fair value gap — first gap (of the last 3) that price is filling
+    if size >= 5:
+        for i in range(size - 5, size - 2):
+            a_high = high[i]
+            a_low = low[i]
+            c_high = high[i + 2]
+            c_low = low[i + 2]
+            if c_low > a_high:
+                gap = (c_low - a_high) / a_high * 100.0 if a_high > 0.0 else 0.0
+                if a_high <= price <= c_low and gap >= 0.05:
+                    bull |= SIG_FVG
+                    fvg_gap_pct = gap
+                    break
+            if c_high < a_low and can_short:
+                gap = (a_low - c_high) / a_low * 100.0 if a_low > 0.0 else 0.0
+                if c_high <= price <= a_low and gap >= 0.05:
+                    bear |= SIG_FVG
+                    fvg_gap_pct = gap
+                    break
+
+    # 11. Volume divergence — price moving on dying volume
+    if size >= 10:
+        older_sum = 0.0
+        recent_sum = 0.0
+        for i in range(5):
+            older_sum += volume[size - 10 + i]
+            recent_sum += volume[size - 5 + i]
+        recent_vol = recent_sum / 5.0
+        older_vol = older_sum / 5.0
+        if older_vol > 0.0 and recent_vol < older_vol * 0.8:
+            voldiv_drop_pct = (1.0 - recent_vol / older_vol) * 100.0
+            if close[size - 1] > close[size - 6] and can_short:
+                bear |= SIG_VOLDIV
+            if close[size - 1] < close[size - 6]:
+                bull |= SIG_VOLDIV
+
+    return bull, bear, tcont_vol_x, fvg_gap_pct, voldiv_drop_pct
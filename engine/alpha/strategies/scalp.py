@@ -81,20 +81,42 @@ EXIT — 3-PHASE SYSTEM (AGGRESSIVE PROFIT LOCK):
 from __future__ import annotations
 
 import asyncio
+import functools
+import logging
 import time
 from collections import deque
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import ccxt.async_support as ccxt
-import pandas as pd
-import ta
+import numpy as np
 
 # IST timezone offset (UTC+5:30)
 IST = timezone(timedelta(hours=5, minutes=30))
 
 from alpha.config import config
+from alpha.pair_fetcher import MultiPairFetcher
+from alpha.strategies._scalp_kernels import (
+    COL_CLOSE,
+    COL_HIGH,
+    COL_LOW,
+    COL_OPEN,
+    COL_TS,
+    COL_VOLUME,
+    SIG_BB,
+    SIG_BBSQZ,
+    SIG_FVG,
+    SIG_MOM,
+    SIG_MOM5M,
+    SIG_RSI,
+    SIG_TCONT,
+    SIG_VOL,
+    SIG_VOLDIV,
+    SIG_VWAP,
+    IndicatorState,
+    signal_masks,
+)
 from alpha.strategies.base import BaseStrategy, Signal, StrategyName
 from alpha.utils import setup_logger
 
@@ -104,6 +126,118 @@ if TYPE_CHECKING:
 
 logger = setup_logger("scalp")
 
+_NS_PER_SEC = 1_000_000_000
+
+_EMPTY_CANDLES = np.empty((0, 6), dtype=np.float64)
+
+# Entry signal bit → dashboard name, in reason order
+_SIGNAL_NAMES: tuple[tuple[int, str], ...] = (
+    (SIG_MOM, "MOM"), (SIG_VOL, "VOL"), (SIG_RSI, "RSI"), (SIG_BB, "BB"),
+    (SIG_MOM5M, "MOM5m"), (SIG_TCONT, "TCONT"), (SIG_VWAP, "VWAP"),
+    (SIG_BBSQZ, "BBSQZ"), (SIG_FVG, "FVG"), (SIG_VOLDIV, "VOLDIV"),
+)
+
+
+def _signal_names(mask: int) -> list[str]:
+    """Names of the signals set in an entry signal mask."""
+    return [name for bit, name in _SIGNAL_NAMES if mask & bit]
+
+
+# Entry signal bit → (bull, bear) reason tag format, in reason order
+_SIGNAL_TAG_FORMATS: tuple[tuple[int, str, str], ...] = (
+    (SIG_MOM, "MOM:{mom:+.2f}%", "MOM:{mom:+.2f}%"),
+    (SIG_VOL, "VOL:{vol:.1f}x", "VOL:{vol:.1f}x"),
+    (SIG_RSI, "RSI:{rsi:.0f}<{rsi_l:.0f}", "RSI:{rsi:.0f}>{rsi_s:.0f}"),
+    (SIG_BB, "BB:low@{bb_pos:.0%}", "BB:high@{bb_pos:.0%}"),
+    (SIG_MOM5M, "MOM5m:{mom_5m:+.2f}%", "MOM5m:{mom_5m:+.2f}%"),
+    (SIG_TCONT, "TCONT:newHigh+vol{tcont_vol:.1f}x", "TCONT:newLow+vol{tcont_vol:.1f}x"),
+    (SIG_VWAP, "VWAP:above+EMA↑({vwap_dist:.2f}%)", "VWAP:below+EMA↓({vwap_dist_neg:.2f}%)"),
+    (SIG_BBSQZ, "BBSQZ:breakout+vol{vol:.1f}x", "BBSQZ:breakout+vol{vol:.1f}x"),
+    (SIG_FVG, "FVG:fill+{fvg_gap:.2f}%", "FVG:fill-{fvg_gap:.2f}%"),
+    (SIG_VOLDIV, "VOLDIV:price↓vol↓{voldiv_drop:.0f}%", "VOLDIV:price↑vol↓{voldiv_drop:.0f}%"),
+)
+
+
+def _format_reason(mask: int, bull: bool, ctx: dict[str, float]) -> list[str]:
+    """Reason tags for the signals set in a fired mask, formatted from ctx."""
+    if bull:
+        return [bull_fmt.format_map(ctx) for bit, bull_fmt, _ in _SIGNAL_TAG_FORMATS if mask & bit]
+    return [bear_fmt.format_map(ctx) for bit, _, bear_fmt in _SIGNAL_TAG_FORMATS if mask & bit]
+
+
+# Breakdown for a quiet tick (no signal fired on either side) — shared, never mutated
+_QUIET_BREAKDOWN: dict[str, Any] = {
+    "bull_count": 0, "bear_count": 0, "bull_mask": 0, "bear_mask": 0,
+    "bull_signals": [], "bear_signals": [],
+    "bull_mom": False, "bull_vol": False, "bull_rsi": False, "bull_bb": False,
+    "bear_mom": False, "bear_vol": False, "bear_rsi": False, "bear_bb": False,
+}
+
+# Position side codes — integer compares on the exit path, strings only at the edges
+SIDE_NONE = 0
+SIDE_LONG = 1
+SIDE_SHORT = -1
+_SIDE_TO_STR: dict[int, str] = {SIDE_LONG: "long", SIDE_SHORT: "short"}
+_STR_TO_SIDE: dict[str, int] = {"long": SIDE_LONG, "short": SIDE_SHORT}
+
+# Hold durations under 10 min, preformatted — nearly every scalp closes inside this
+_HOLD_STRINGS: tuple[str, ...] = tuple(
+    f"{sec // 60}m{sec % 60:02d}s" if sec >= 60 else f"{sec}s" for sec in range(600)
+)
+
+
+def _format_hold(hold_sec: int) -> str:
+    if 0 <= hold_sec < 600:
+        return _HOLD_STRINGS[hold_sec]
+    return f"{hold_sec // 60}m{hold_sec % 60:02d}s"
+
+
+# Reversal triggers in the exit path — formatted to text only when logged
+_REV_NONE = 0
+_REV_MOM_FLIP = 1
+_REV_MOM_DYING = 2
+
+# Exits that bypass the fee minimum — they protect capital or locked profit
+_PROTECTED_EXIT_TYPES = frozenset({
+    "SL", "TRAIL", "BREAKEVEN", "PROFIT_LOCK",
+    "HARD_TP", "HARD_TP_10PCT", "RATCHET", "SAFETY",
+})
+
+
+class ExitDecision(NamedTuple):
+    """An exit the scalp exit logic decided on — the Signal is built from it."""
+    exit_type: str
+    pnl_pct: float
+
+
+# Running PnL aggregate (count, mean, sum of squared deviations) — Welford
+PnlAgg = tuple[int, float, float]
+_EMPTY_PNL_AGG: PnlAgg = (0, 0.0, 0.0)
+
+
+def _pnl_agg_since(total: PnlAgg, prefix: PnlAgg) -> PnlAgg:
+    """Aggregate of the trades in `total` that came after `prefix` (Chan et al.)."""
+    n, mu, ssd = total
+    n_a, mu_a, ssd_a = prefix
+    n_b = n - n_a
+    if n_b <= 0:
+        return _EMPTY_PNL_AGG
+    mu_b = (n * mu - n_a * mu_a) / n_b
+    delta = mu_b - mu_a
+    ssd_b = ssd - ssd_a - delta * delta * n_a * n_b / n
+    return n_b, mu_b, max(ssd_b, 0.0)
+
+
+def _pnl_agg_merge(a: PnlAgg, b: PnlAgg) -> PnlAgg:
+    """Aggregate of two disjoint sets of trades (Chan et al.)."""
+    n_a, mu_a, ssd_a = a
+    n_b, mu_b, ssd_b = b
+    n = n_a + n_b
+    if n_a == 0 or n_b == 0:
+        return b if n_a == 0 else a
+    delta = mu_b - mu_a
+    return n, mu_a + delta * n_b / n, ssd_a + ssd_b + delta * delta * n_a * n_b / n
+
 
 # ══════════════════════════════════════════════════════════════════════
 # SOUL LOADER — read principles before every decision
@@ -181,6 +315,25 @@ class ScalpStrategy(BaseStrategy):
     name = StrategyName.SCALP
     check_interval_sec = 5  # 5 second ticks — patient, not frantic
 
+    # Hot state in slots — read on every check() / WebSocket exit tick / close.
+    # BaseStrategy has no __slots__, so cold attributes still land in __dict__.
+    __slots__ = (
+        # BaseStrategy fields — the slot descriptors here take precedence
+        "pair", "executor", "risk_manager", "logger", "is_active",
+        "trade_exchange", "is_futures", "leverage", "_base_asset", "_exchange_id", "_pair_enabled",
+        "in_position", "position_side_code", "entry_price", "entry_amount", "entry_time",
+        "highest_since_entry", "lowest_since_entry", "_peak_unrealized_pnl", "_profit_floor_pct",
+        "_trailing_active", "_trail_stop_price", "_trail_distance_pct", "_sl_pct", "_tp_pct",
+        "_sl_mult_long", "_sl_mult_short", "_mom_flip_since", "_reversal_exit_logged",
+        "_tick_count", "_in_position_tick", "_hourly_trades", "_ind_state", "_candles", "_fetcher",
+        "_skip_reason", "last_signal_state", "_last_signal_breakdown", "_prev_rsi", "_market_regime",
+        "_phantom_cooldown_until", "_last_ws_sl_log", "_last_heartbeat", "_last_position_exit",
+        # Close path
+        "_entry_fee_rate", "_exit_fee_rate", "_round_trip_fee_rate", "_coin_per_amount",
+        "hourly_wins", "hourly_losses", "hourly_pnl", "hourly_skipped", "_daily_scalp_loss",
+        "_pnl_agg", "_win_streak", "_max_win_streak", "_max_loss_streak",
+    )
+
     # ── Per-pair SL distances — FIXED on entry, locked for 3 min ─────
     STOP_LOSS_PCT = 0.25              # default fallback (was 0.35)
     MIN_TP_PCT = 1.50                 # default TP
@@ -246,6 +399,12 @@ class ScalpStrategy(BaseStrategy):
         (2.00, 0.70),   # peak +2.00% → trail 0.70% from peak
         (3.00, 1.00),   # peak +3.00% → trail 1.00% from peak
     ]
+    # Highest tier first, with each side's stop multiplier precomputed:
+    # (min_peak, trail_dist, long_mult, short_mult)
+    _TRAIL_TIERS_DESC: tuple[tuple[float, float, float, float], ...] = tuple(
+        (min_peak, trail_dist, 1 - trail_dist / 100, 1 + trail_dist / 100)
+        for min_peak, trail_dist in reversed(TRAIL_TIER_TABLE)
+    )
 
     # ── Legacy trailing defaults (futures=0, spot overrides in __init__) ─
     TRAILING_ACTIVATE_PCT = 0.0       # futures: no trailing (momentum riding instead)
@@ -329,6 +488,7 @@ class ScalpStrategy(BaseStrategy):
     PERF_HIGH_WR_THRESHOLD = 0.60       # >60% WR in window → boost allocation
     MAX_POSITIONS = 99                  # no hard cap — allocation % handles sizing naturally
     MAX_SPREAD_PCT = 0.15
+    OHLCV_CANDLES = 30                  # 1m candles per indicator window (tail-only refresh once primed)
 
     # ── Warmup — accept weaker signals for first 5 min after startup ────
     WARMUP_SECONDS = 5 * 60            # 5 min warmup: still requires 3/4 (no free passes)
@@ -350,12 +510,15 @@ class ScalpStrategy(BaseStrategy):
     _live_pnl: dict[str, float] = {}           # pair → current unrealized P&L % (updated every tick)
     _pair_trade_history: dict[str, list[bool]] = {}  # base_asset → list of win/loss booleans (last N)
     # ── Per-pair streak/cooldown (BTC losses don't pause XRP) ────────────
-    _pair_last_sl_time: dict[str, float] = {}            # base_asset → monotonic time of last SL
+    _pair_last_sl_time: dict[str, int] = {}              # base_asset → monotonic_ns of last SL
     _pair_consecutive_losses: dict[str, int] = {}        # base_asset → streak count
-    _pair_streak_pause_until: dict[str, float] = {}      # base_asset → pause end time
+    _pair_streak_pause_until: dict[str, int] = {}        # base_asset → pause end (monotonic_ns)
     _pair_post_streak: dict[str, bool] = {}              # base_asset → True if first trade after streak
-    _pair_last_reversal_time: dict[str, float] = {}      # base_asset → monotonic time of last REVERSAL exit
+    _pair_last_reversal_time: dict[str, int] = {}        # base_asset → monotonic_ns of last REVERSAL exit
     _pair_last_reversal_side: dict[str, str] = {}        # base_asset → side of the REVERSAL exit (blocks same-dir re-entry)
+    # Latest SL-cooldown / streak-pause end on ANY pair (monotonic_ns) — once the
+    # clock passes it, no pair is paused and check() skips the per-pair lookups
+    _pause_horizon_ns: int = 0
 
     # ── Daily expiry (Delta India) ──────────────────────────────────────
     EXPIRY_HOUR_IST = 17
@@ -380,17 +543,40 @@ class ScalpStrategy(BaseStrategy):
         self._exchange_id: str = "delta" if is_futures else "binance"
         self._market_analyzer = market_analyzer  # for 15m trend direction
 
+        # Per-side fee rates seeded from the executor's loaded (API) rates; later
+        # refreshes are pushed through _on_fee_update.
+        # Delta: maker entry + taker exit (incl 18% GST). Binance: taker both sides.
+        if is_futures:
+            self._entry_fee_rate: float = getattr(
+                executor, "_delta_maker_fee", config.delta.maker_fee_with_gst,
+            )
+            self._exit_fee_rate: float = getattr(
+                executor, "_delta_taker_fee", config.delta.taker_fee_with_gst,
+            )
+        else:
+            self._entry_fee_rate = getattr(executor, "_binance_taker_fee", 0.001)
+            self._exit_fee_rate = self._entry_fee_rate
+        self._round_trip_fee_rate: float = self._entry_fee_rate + self._exit_fee_rate
+        executor.on_fee_update(self._on_fee_update)
+
+        # Coins per unit of entry_amount — futures amounts are in contracts
+        self._coin_per_amount: float = 1.0
+        if is_futures:
+            from alpha.trade_executor import DELTA_CONTRACT_SIZE
+            self._coin_per_amount = DELTA_CONTRACT_SIZE.get(pair, 0.01)
+
         base_asset = pair.split("/")[0] if "/" in pair else pair.replace("USD", "").replace(":USD", "")
         self._base_asset = base_asset  # cached for SL/TP lookup
 
         # Dynamic ATR-based SL/TP — updated every tick from 1m candles
         # Spot uses wider SL/TP (no leverage, needs more room)
         if not is_futures:
-            self._sl_pct: float = self.SPOT_SL_PCT
-            self._tp_pct: float = self.SPOT_TP_PCT
+            self._set_sl_tp(self.SPOT_SL_PCT, self.SPOT_TP_PCT)
         else:
-            self._sl_pct = self.PAIR_SL_FLOOR.get(base_asset, self.STOP_LOSS_PCT)
-            self._tp_pct = self.PAIR_TP_FLOOR.get(base_asset, self.MIN_TP_PCT)
+            self._set_sl_tp(
+                self.PAIR_SL_FLOOR.get(base_asset, self.STOP_LOSS_PCT),
+                self.PAIR_TP_FLOOR.get(base_asset, self.MIN_TP_PCT),
+            )
         self._last_atr_pct: float = 0.0  # last computed 1m ATR as % of price
         self._atr_history: deque[float] = deque(maxlen=60)  # rolling ~1hr of ATR samples
         self._high_vol: bool = False  # True when ATR > 1.5x normal
@@ -405,7 +591,7 @@ class ScalpStrategy(BaseStrategy):
 
         # Position state
         self.in_position = False
-        self.position_side: str | None = None  # "long" or "short"
+        self.position_side_code: int = SIDE_NONE  # SIDE_LONG / SIDE_SHORT / SIDE_NONE
         self.entry_price: float = 0.0
         self.entry_amount: float = 0.0
         self.entry_time: float = 0.0
@@ -440,7 +626,9 @@ class ScalpStrategy(BaseStrategy):
         self._reversal_exit_logged: bool = False
 
         # Rate limiting
-        self._hourly_trades: list[float] = []
+        # Monotonic entry times, oldest first. Capped at the rate limit: once it
+        # holds MAX_TRADES_PER_HOUR recent entries, no further entry is allowed
+        self._hourly_trades: deque[float] = deque(maxlen=self.MAX_TRADES_PER_HOUR)
         self._daily_scalp_loss: float = 0.0
 
         # No more forced entries — we wait for quality setups
@@ -449,6 +637,7 @@ class ScalpStrategy(BaseStrategy):
         self._phantom_cooldown_until: float = 0.0
         # Rate limit rejection logs
         self._last_reject_log: float = 0.0
+        self._reject_count: int = 0  # rejected entries since startup
         # Periodic SL check logging (every 10s while in position)
         self._last_ws_sl_log: float = 0.0
 
@@ -457,6 +646,22 @@ class ScalpStrategy(BaseStrategy):
         self.hourly_losses: int = 0
         self.hourly_pnl: float = 0.0
         self.hourly_skipped: int = 0  # track skipped low-quality signals
+        # Net PnL aggregate since the daily reset; the hour's window is derived
+        # from it and the snapshot taken at the last hourly reset
+        self._pnl_agg: PnlAgg = _EMPTY_PNL_AGG
+        self._pnl_agg_hour_start: PnlAgg = _EMPTY_PNL_AGG
+        # This hour's trades closed before a daily reset — folded back in hourly
+        self._pnl_agg_hour_carry: PnlAgg = _EMPTY_PNL_AGG
+        # Streaks on this strategy since the daily reset (loss streak is per pair, class-level)
+        self._win_streak: int = 0
+        self._max_win_streak: int = 0
+        self._max_loss_streak: int = 0
+        # Reused by reset_hourly_stats() — caller gets a shallow copy
+        self._hourly_stats_buf: dict[str, Any] = {
+            "pair": pair, "wins": 0, "losses": 0, "pnl": 0.0, "trades": 0, "skipped": 0,
+            "pnl_mean": 0.0, "pnl_variance": 0.0, "max_win_streak": 0, "max_loss_streak": 0,
+            "day_trades": 0, "day_pnl": 0.0, "day_pnl_variance": 0.0,
+        }
 
         # Tick tracking
         self._tick_count: int = 0
@@ -472,19 +677,83 @@ class ScalpStrategy(BaseStrategy):
 
         # BB Squeeze tracking (signal #8)
         self._squeeze_tick_count: int = 0
+        # Cross-tick indicator state (RSI/EMA/ATR recursions, rolling BB/VWAP sums)
+        self._ind_state = IndicatorState()
+        self._candles: np.ndarray | None = None  # last OHLCV window, refreshed by tail fetches
+        # Scanning candle / spread-ticker requests batched with other pairs on this exchange
+        self._fetcher = MultiPairFetcher.shared(executor, exchange or executor.exchange)
+
+        # Entry metadata templates — copied per entry instead of rebuilding the literal
+        self._long_meta_template: dict[str, Any] = {
+            "pending_side": "long", "pending_amount": 0.0,
+            "tp_price": 0.0, "sl_price": 0.0, "sl_pct": 0.0, "tp_pct": 0.0,
+            "atr_pct": 0.0, "setup_type": "",
+        }
+        self._short_meta_template: dict[str, Any] = dict(self._long_meta_template, pending_side="short")
+
+        # Entry Signal prototypes — the per-instance constant fields bound once,
+        # each entry only supplies price/amount/order_type/reason/SL/metadata
+        self._long_entry_proto = functools.partial(
+            Signal,
+            side="buy",
+            strategy=self.name,
+            pair=self.pair,
+            take_profit=None,  # trailing stop handles exit
+            leverage=self.leverage if self.is_futures else 1,
+            position_type="long" if self.is_futures else "spot",
+            exchange_id="delta" if self.is_futures else "binance",
+        )
+        self._short_entry_proto = functools.partial(
+            Signal,
+            side="sell",
+            strategy=self.name,
+            pair=self.pair,
+            take_profit=None,  # trailing stop handles exit
+            leverage=self.leverage,
+            position_type="short",
+            exchange_id="delta",
+        )
+        # Exit Signal prototypes keyed by the position side being closed
+        self._exit_leverage: int = self.leverage if self.is_futures else 1
+        self._exit_protos: dict[str, functools.partial[Signal]] = {
+            pos_side: functools.partial(
+                Signal,
+                side=exit_side,
+                order_type="market",
+                strategy=self.name,
+                pair=self.pair,
+                leverage=self._exit_leverage,
+                position_type=pos_side if self.is_futures else "spot",
+                reduce_only=self.is_futures,
+                exchange_id=self._exchange_id,
+            )
+            for pos_side, exit_side in (("long", "sell"), ("short", "buy"))
+        }
 
         # Load soul on init
         _load_soul()
 
+    @property
+    def position_side(self) -> str | None:
+        """String view of position_side_code: "long", "short" or None."""
+        return _SIDE_TO_STR.get(self.position_side_code)
+
+    @position_side.setter
+    def position_side(self, side: str | None) -> None:
+        self.position_side_code = _STR_TO_SIDE.get(side, SIDE_NONE) if side else SIDE_NONE
+
     async def on_start(self) -> None:
         if not self.in_position:
             self.position_side = None
             self.entry_price = 0.0
             self.entry_amount = 0.0
         self._tick_count = 0
-        self._strategy_start_time = time.monotonic()
-        self._last_heartbeat = time.monotonic()
-        self._last_position_exit = time.monotonic()
+        self._ind_state = IndicatorState()
+        self._candles = None
+        now = time.monotonic()
+        self._strategy_start_time = now
+        self._last_heartbeat = now
+        self._last_position_exit = now
         tag = f"{self.leverage}x futures" if self.is_futures else "spot"
         pos_info = ""
         if self.in_position:
@@ -552,7 +821,7 @@ class ScalpStrategy(BaseStrategy):
             return "neutral"
         return analysis.direction or "neutral"
 
-    def _update_dynamic_sl_tp(self, df: pd.DataFrame, current_price: float) -> None:
+    def _update_dynamic_sl_tp(self, atr: float, current_price: float) -> None:
         """Compute ATR-based SL/TP from 1m candles.
 
         Formula:
@@ -563,13 +832,8 @@ class ScalpStrategy(BaseStrategy):
         tight stops on low-vol pairs (BTC).
         """
         try:
-            high = df["high"]
-            low = df["low"]
-            close = df["close"]
-            if len(close) < 15:
-                return  # not enough data, keep existing values
-            atr_indicator = ta.volatility.AverageTrueRange(high, low, close, window=14)
-            atr = float(atr_indicator.average_true_range().iloc[-1])
+            if atr <= 0:
+                return  # not enough data (< 15 candles), keep existing values
             atr_pct = (atr / current_price) * 100 if current_price > 0 else 0.0
             self._last_atr_pct = atr_pct
 
@@ -587,8 +851,8 @@ class ScalpStrategy(BaseStrategy):
                 tp_floor = self.PAIR_TP_FLOOR.get(self._base_asset, self.MIN_TP_PCT)
 
             # Dynamic: ATR-based, but never below floor
-            self._sl_pct = max(sl_floor, atr_pct * self.ATR_SL_MULTIPLIER)
-            self._tp_pct = max(tp_floor, atr_pct * self.ATR_TP_MULTIPLIER)
+            sl_pct = max(sl_floor, atr_pct * self.ATR_SL_MULTIPLIER)
+            tp_pct = max(tp_floor, atr_pct * self.ATR_TP_MULTIPLIER)
 
             # Safety cap — widen during high volatility
             if not self.is_futures:
@@ -602,13 +866,21 @@ class ScalpStrategy(BaseStrategy):
             else:
                 sl_cap = 0.50
             tp_cap = 6.00 if not self.is_futures else 5.00
-            self._sl_pct = min(self._sl_pct, sl_cap)
-            self._tp_pct = min(self._tp_pct, tp_cap)
+            self._set_sl_tp(min(sl_pct, sl_cap), min(tp_pct, tp_cap))
         except Exception:
             # Silently keep existing values if ATR calc fails
             pass
 
-    def _detect_market_regime(self, df: pd.DataFrame) -> str:
+    def _set_sl_tp(self, sl_pct: float, tp_pct: float) -> None:
+        """Set SL/TP % and the entry-price multipliers the exit paths use."""
+        self._sl_pct: float = sl_pct
+        self._tp_pct: float = tp_pct
+        self._sl_mult_long: float = 1 - sl_pct / 100
+        self._sl_mult_short: float = 1 + sl_pct / 100
+        self._tp_mult_long: float = 1 + tp_pct / 100
+        self._tp_mult_short: float = 1 - tp_pct / 100
+
+    def _detect_market_regime(self, candles: np.ndarray) -> str:
         """Detect market regime from 30x 1m candles.
 
         Returns one of: TRENDING_UP, TRENDING_DOWN, SIDEWAYS, CHOPPY.
@@ -622,28 +894,24 @@ class ScalpStrategy(BaseStrategy):
         CHOPPY blocks ALL entries. Other regimes adjust signal requirements.
         """
         try:
-            closes = df["close"].tolist()
-            opens = df["open"].tolist()
-            if len(closes) < 10:
+            closes = candles[:, COL_CLOSE]
+            n = len(closes)
+            if n < 10:
                 return self._market_regime  # not enough data, keep current
 
             # 1. Net price change over 30 candles
-            net_change = ((closes[-1] - closes[0]) / closes[0]) * 100 if closes[0] > 0 else 0
+            first_close = float(closes[0])
+            net_change = ((float(closes[-1]) - first_close) / first_close) * 100 if first_close > 0 else 0
             self._net_change_30m = net_change
 
             # 2. Direction ratio — count candles moving in same direction
-            up_candles = sum(1 for i in range(len(closes)) if closes[i] > opens[i])
-            n = len(closes)
+            up_candles = int(np.count_nonzero(closes > candles[:, COL_OPEN]))
             direction_ratio = max(up_candles, n - up_candles) / n
 
             # 3. Chop score — count direction changes (close > prev close)
-            direction_changes = 0
-            for i in range(2, len(closes)):
-                curr_up = closes[i] > closes[i - 1]
-                prev_up = closes[i - 1] > closes[i - 2]
-                if curr_up != prev_up:
-                    direction_changes += 1
-            chop_score = direction_changes / (len(closes) - 2) if len(closes) > 2 else 0
+            steps_up = closes[1:] > closes[:-1]
+            direction_changes = int(np.count_nonzero(steps_up[1:] != steps_up[:-1]))
+            chop_score = direction_changes / (n - 2)
             self._chop_score = chop_score
 
             # 4. ATR ratio — current ATR vs rolling average
@@ -705,12 +973,51 @@ class ScalpStrategy(BaseStrategy):
             self.logger.debug("[%s] Regime detection error, keeping %s", self.pair, self._market_regime)
             return self._market_regime
 
+    async def _fetch_ohlcv(self, exchange: Any, limit: int) -> list:
+        """1m OHLCV rows — direct while in position so exit checks never wait on
+        other pairs, batched through the shared MultiPairFetcher while scanning."""
+        if self.in_position:
+            return await exchange.fetch_ohlcv(self.pair, "1m", limit=limit)
+        return await self._fetcher.fetch_ohlcv(self.pair, limit)
+
+    async def _fetch_candles(self, exchange: Any) -> np.ndarray:
+        """Latest OHLCV_CANDLES 1m candles as a float64 ndarray.
+
+        Once a window is cached only the last 2 candles are fetched — enough to
+        finalize the candle that just closed and refresh the forming one.
+        Any gap falls back to a full fetch.
+        """
+        cached = self._candles
+        if cached is not None:
+            tail = np.asarray(await self._fetch_ohlcv(exchange, 2), dtype=np.float64)
+            if len(tail) == 2:
+                last_ts = cached[-1, COL_TS]
+                if tail[1, COL_TS] == last_ts and tail[0, COL_TS] == cached[-2, COL_TS]:
+                    cached[-2:] = tail  # same forming candle
+                    return cached
+                if tail[0, COL_TS] == last_ts:
+                    cached = np.concatenate((cached[1:-1], tail))  # one candle closed
+                    self._candles = cached
+                    return cached
+        ohlcv = await self._fetch_ohlcv(exchange, self.OHLCV_CANDLES)
+        candles = np.asarray(ohlcv, dtype=np.float64)
+        self._candles = candles if len(candles) == self.OHLCV_CANDLES else None
+        return candles
+
+    async def _fetch_ticker_or_none(self) -> dict | None:
+        """Ticker for the spread check — None on any error (check is best-effort)."""
+        try:
+            return await self._fetcher.fetch_ticker(self.pair)
+        except Exception:
+            return None
+
     async def check(self) -> list[Signal]:
         """One scalping tick — fetch candles, detect QUALITY momentum, manage exits."""
         signals: list[Signal] = []
         self._tick_count += 1
         exchange = self.trade_exchange or self.executor.exchange
-        now = time.monotonic()
+        now_ns = time.monotonic_ns()  # integer clock for the per-pair pause checks
+        now = now_ns / _NS_PER_SEC
 
         # ── DISABLED PAIRS — skip entirely (SOL = 0% win rate) ─────────
         if self._base_asset in self.DISABLED_PAIRS:
@@ -751,13 +1058,15 @@ class ScalpStrategy(BaseStrategy):
             return signals
 
         # ── Rate limit — quality over quantity ─────────────────────────
-        cutoff = time.time() - 3600
-        self._hourly_trades = [t for t in self._hourly_trades if t > cutoff]
-        if len(self._hourly_trades) >= self.MAX_TRADES_PER_HOUR:
+        cutoff = now - 3600
+        hourly_trades = self._hourly_trades
+        while hourly_trades and hourly_trades[0] <= cutoff:
+            hourly_trades.popleft()
+        if len(hourly_trades) >= self.MAX_TRADES_PER_HOUR:
             if self._tick_count % 60 == 0:
                 self.logger.info(
                     "[%s] Rate limit: %d/%d trades this hour — waiting",
-                    self.pair, len(self._hourly_trades), self.MAX_TRADES_PER_HOUR,
+                    self.pair, len(hourly_trades), self.MAX_TRADES_PER_HOUR,
                 )
             return signals
 
@@ -775,8 +1084,7 @@ class ScalpStrategy(BaseStrategy):
         ema_21 = 0.0
         kc_upper = 0.0
         kc_lower = 0.0
-        rsi_series: pd.Series | None = None
-        df: pd.DataFrame | None = None
+        candles: np.ndarray | None = None
         _need_full_indicators = True
 
         if self.in_position:
@@ -794,66 +1102,42 @@ class ScalpStrategy(BaseStrategy):
                 _need_full_indicators = True
 
         if _need_full_indicators:
-            # Full OHLCV fetch — for entry detection OR periodic in-position refresh
-            ohlcv = await exchange.fetch_ohlcv(self.pair, "1m", limit=30)
-            df = pd.DataFrame(ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"])
-            close = df["close"]
-            volume = df["volume"]
-            current_price = float(close.iloc[-1])
+            # OHLCV refresh — for entry detection OR periodic in-position refresh
+            candles = await self._fetch_candles(exchange)
+            close = candles[:, COL_CLOSE]
+            volume = candles[:, COL_VOLUME]
+            current_price = float(close[-1])
+
+            # Indicators from the cross-tick state — O(1) unless a bar just closed
+            (
+                rsi_now, bb_upper, bb_lower, _,
+                kc_upper, kc_lower, ema_9, ema_21, avg_vol, vwap, atr_14,
+            ) = self._ind_state.update(candles)
 
             # Update dynamic ATR-based SL/TP
-            self._update_dynamic_sl_tp(df, current_price)
+            self._update_dynamic_sl_tp(atr_14, current_price)
 
             # Detect market regime (TRENDING_UP/DOWN, SIDEWAYS, CHOPPY)
-            self._detect_market_regime(df)
-
-            # Compute indicators
-            rsi_series = ta.momentum.RSIIndicator(close, window=14).rsi()
-            rsi_now = float(rsi_series.iloc[-1]) if not rsi_series.empty else 50.0
-
-            bb = ta.volatility.BollingerBands(close, window=20, window_dev=2)
-            bb_upper = float(bb.bollinger_hband().iloc[-1])
-            bb_lower = float(bb.bollinger_lband().iloc[-1])
-
-            # Keltner Channel (for BB Squeeze detection)
-            kc = ta.volatility.KeltnerChannel(
-                high=df["high"], low=df["low"], close=close,
-                window=20, window_atr=10, multiplier=1.5,
-                original_version=False,
-            )
-            kc_upper = float(kc.keltner_channel_hband().iloc[-1])
-            kc_lower = float(kc.keltner_channel_lband().iloc[-1])
+            self._detect_market_regime(candles)
 
             # Volume ratio (current vs 10-candle average)
-            avg_vol = float(volume.iloc[-11:-1].mean()) if len(volume) >= 11 else float(volume.mean())
-            current_vol = float(volume.iloc[-1])
+            current_vol = float(volume[-1])
             vol_ratio = current_vol / avg_vol if avg_vol > 0 else 0
 
             # 60-second momentum (last 1 full candle)
-            price_1m_ago = float(close.iloc[-2]) if len(close) >= 2 else current_price
+            price_1m_ago = float(close[-2]) if len(close) >= 2 else current_price
             momentum_60s = ((current_price - price_1m_ago) / price_1m_ago * 100) if price_1m_ago > 0 else 0
 
             # 2-candle momentum (120 seconds) for trend confirmation
-            price_2m_ago = float(close.iloc[-3]) if len(close) >= 3 else price_1m_ago
+            price_2m_ago = float(close[-3]) if len(close) >= 3 else price_1m_ago
             momentum_120s = ((current_price - price_2m_ago) / price_2m_ago * 100) if price_2m_ago > 0 else 0
 
             # 5-candle momentum (300 seconds) for slow bleed detection
-            price_5m_ago = float(close.iloc[-6]) if len(close) >= 6 else price_2m_ago
+            price_5m_ago = float(close[-6]) if len(close) >= 6 else price_2m_ago
             momentum_300s = ((current_price - price_5m_ago) / price_5m_ago * 100) if price_5m_ago > 0 else 0
 
-            # VWAP (Volume Weighted Average Price) — session VWAP over 30 candles
-            typical_price = (df["high"] + df["low"] + df["close"]) / 3
-            cumulative_tp_vol = (typical_price * df["volume"]).cumsum()
-            cumulative_vol = df["volume"].cumsum()
-            vwap_series = cumulative_tp_vol / cumulative_vol.replace(0, float("nan"))
-            vwap = float(vwap_series.iloc[-1]) if not vwap_series.empty else current_price
-
-            # 9 EMA and 21 EMA — momentum ribbon
-            ema_9 = float(close.ewm(span=9, adjust=False).mean().iloc[-1])
-            ema_21 = float(close.ewm(span=21, adjust=False).mean().iloc[-1])
-
         # ── Heartbeat every 60 seconds ─────────────────────────────────
-        if now - self._last_heartbeat >= 60:
+        if now - self._last_heartbeat >= 60 and self.logger.isEnabledFor(logging.INFO):
             self._last_heartbeat = now
             tag = f"{self.leverage}x" if self.is_futures else "spot"
             if self.in_position:
@@ -880,7 +1164,7 @@ class ScalpStrategy(BaseStrategy):
             # Keep signal state timestamp fresh while in position so options_scalp
             # doesn't see it as stale. Preserve existing signal data (side/strength).
             if self.last_signal_state is not None:
-                self.last_signal_state["timestamp"] = time.monotonic()
+                self.last_signal_state["timestamp"] = now
                 self.last_signal_state["current_price"] = current_price
 
             # Update class-level live P&L (shared, so 2nd position gate can check)
@@ -898,9 +1182,9 @@ class ScalpStrategy(BaseStrategy):
                 )
                 return self._do_exit(
                     current_price, pnl_pct, self.position_side or "long",
-                    "EXPIRY", time.monotonic() - self.entry_time,
+                    "EXPIRY", now - self.entry_time,
                 )
-            result = self._check_exits(current_price, rsi_now, momentum_60s)
+            result = self._check_exits(current_price, rsi_now, momentum_60s, now)
             self._prev_rsi = rsi_now
             return result
 
@@ -913,47 +1197,47 @@ class ScalpStrategy(BaseStrategy):
             self._skip_reason = "ALREADY_IN_POSITION"
             # Refresh timestamp so options_scalp doesn't see stale signal
             if self.last_signal_state is not None:
-                self.last_signal_state["timestamp"] = time.monotonic()
+                self.last_signal_state["timestamp"] = now
                 self.last_signal_state["current_price"] = current_price
             return signals
 
-        total_scalp = sum(
-            1 for p in self.risk_manager.open_positions
-            if p.strategy == "scalp"
-        )
+        total_scalp = self.risk_manager.strategy_position_count(StrategyName.SCALP.value)
         max_pos = self.SPOT_MAX_POSITIONS if not self.is_futures else self.MAX_POSITIONS
         if total_scalp >= max_pos:
             self._skip_reason = f"MAX_POSITIONS ({total_scalp}/{max_pos})"
             # Refresh timestamp so options_scalp doesn't see stale signal
             if self.last_signal_state is not None:
-                self.last_signal_state["timestamp"] = time.monotonic()
+                self.last_signal_state["timestamp"] = now
                 self.last_signal_state["current_price"] = current_price
             return signals
 
-        # ── COOLDOWN: pause after SL hit (PER PAIR) ────────────────
-        pair_sl_time = ScalpStrategy._pair_last_sl_time.get(self._base_asset, 0.0)
-        sl_cooldown_remaining = pair_sl_time + self.SL_COOLDOWN_SECONDS - now
-        if sl_cooldown_remaining > 0:
-            self._skip_reason = f"SL_COOLDOWN ({int(sl_cooldown_remaining)}s)"
-            if self._tick_count % 12 == 0:
-                self.logger.info(
-                    "[%s] SL COOLDOWN — %.0fs remaining before new entries",
-                    self.pair, sl_cooldown_remaining,
-                )
-            return signals
+        # ── Pause gates — skipped outright while no pair is paused ──────
+        if now_ns < ScalpStrategy._pause_horizon_ns:
+            # ── COOLDOWN: pause after SL hit (PER PAIR) ────────────────
+            pair_sl_time_ns = ScalpStrategy._pair_last_sl_time.get(self._base_asset, 0)
+            sl_cooldown_remaining_ns = pair_sl_time_ns + self.SL_COOLDOWN_SECONDS * _NS_PER_SEC - now_ns
+            if sl_cooldown_remaining_ns > 0:
+                sl_cooldown_remaining = sl_cooldown_remaining_ns // _NS_PER_SEC
+                self._skip_reason = f"SL_COOLDOWN ({sl_cooldown_remaining}s)"
+                if self._tick_count % 12 == 0:
+                    self.logger.info(
+                        "[%s] SL COOLDOWN — %ds remaining before new entries",
+                        self.pair, sl_cooldown_remaining,
+                    )
+                return signals
 
-        # ── STREAK PAUSE: after N consecutive losses on THIS PAIR ───
-        pair_pause_until = ScalpStrategy._pair_streak_pause_until.get(self._base_asset, 0.0)
-        if now < pair_pause_until:
-            remaining = pair_pause_until - now
-            pair_losses = ScalpStrategy._pair_consecutive_losses.get(self._base_asset, 0)
-            self._skip_reason = f"STREAK_PAUSE ({pair_losses}L, {int(remaining)}s)"
-            if self._tick_count % 12 == 0:
-                self.logger.info(
-                    "[%s] STREAK PAUSE — %d consecutive losses on %s, %.0fs remaining",
-                    self.pair, pair_losses, self._base_asset, remaining,
-                )
-            return signals
+            # ── STREAK PAUSE: after N consecutive losses on THIS PAIR ───
+            pair_pause_until_ns = ScalpStrategy._pair_streak_pause_until.get(self._base_asset, 0)
+            if now_ns < pair_pause_until_ns:
+                remaining = (pair_pause_until_ns - now_ns) // _NS_PER_SEC
+                pair_losses = ScalpStrategy._pair_consecutive_losses.get(self._base_asset, 0)
+                self._skip_reason = f"STREAK_PAUSE ({pair_losses}L, {remaining}s)"
+                if self._tick_count % 12 == 0:
+                    self.logger.info(
+                        "[%s] STREAK PAUSE — %d consecutive losses on %s, %ds remaining",
+                        self.pair, pair_losses, self._base_asset, remaining,
+                    )
+                return signals
 
         # ── PHANTOM COOLDOWN: no entries for 60s after phantom clear ──
         if now < self._phantom_cooldown_until:
@@ -966,18 +1250,16 @@ class ScalpStrategy(BaseStrategy):
                 )
             return signals
 
-        # Spread check
-        try:
-            ticker = await exchange.fetch_ticker(self.pair)
-            bid = ticker.get("bid", 0) or 0
-            ask = ticker.get("ask", 0) or 0
+        # Spread check — ticker fetched only once every cheaper gate has passed
+        scan_ticker = await self._fetch_ticker_or_none()
+        if scan_ticker is not None:
+            bid = scan_ticker.get("bid", 0) or 0
+            ask = scan_ticker.get("ask", 0) or 0
             if bid > 0 and ask > 0:
                 spread_pct = ((ask - bid) / bid) * 100
                 if spread_pct > self.MAX_SPREAD_PCT:
                     self._skip_reason = f"SPREAD_TOO_WIDE ({spread_pct:.2f}%)"
                     return signals
-        except Exception:
-            pass
 
         # Balance check
         available = self.risk_manager.get_available_capital(self._exchange_id)
@@ -995,7 +1277,7 @@ class ScalpStrategy(BaseStrategy):
         if self._market_regime == "CHOPPY":
             self._skip_reason = "REGIME_CHOPPY"
             if self._tick_count % 12 == 0:
-                regime_sec = int(time.monotonic() - self._regime_since)
+                regime_sec = int(now - self._regime_since)
                 self.logger.info(
                     "[%s] REGIME BLOCK: CHOPPY for %ds — no entries (chop=%.2f, atr=%.1fx)",
                     self.pair, regime_sec, self._chop_score, self._atr_ratio,
@@ -1016,13 +1298,12 @@ class ScalpStrategy(BaseStrategy):
             bb_upper, bb_lower,
             trend_15m,
             widened=is_widened,
-            df=df,
+            candles=candles,
             vwap=vwap,
             ema_9=ema_9,
             ema_21=ema_21,
             kc_upper=kc_upper,
             kc_lower=kc_lower,
-            rsi_series=rsi_series,
         )
 
         if entry is not None:
@@ -1037,29 +1318,30 @@ class ScalpStrategy(BaseStrategy):
                 "rsi": rsi_now,
                 "momentum_60s": momentum_60s,
                 "current_price": current_price,
-                "timestamp": time.monotonic(),
+                "timestamp": now,
                 **self._last_signal_breakdown,
             }
 
             # ── REVERSAL COOLDOWN: don't re-enter same direction after reversal exit ──
-            rev_time = ScalpStrategy._pair_last_reversal_time.get(self._base_asset, 0.0)
-            rev_remaining = rev_time + self.REVERSAL_COOLDOWN_SECONDS - now
-            if rev_remaining > 0:
+            rev_time_ns = ScalpStrategy._pair_last_reversal_time.get(self._base_asset, 0)
+            rev_remaining_ns = rev_time_ns + self.REVERSAL_COOLDOWN_SECONDS * _NS_PER_SEC - now_ns
+            if rev_remaining_ns > 0:
                 rev_side = ScalpStrategy._pair_last_reversal_side.get(self._base_asset, "")
                 if side == rev_side:
-                    self._skip_reason = f"REVERSAL_COOLDOWN ({int(rev_remaining)}s, was {rev_side})"
+                    rev_remaining = rev_remaining_ns // _NS_PER_SEC
+                    self._skip_reason = f"REVERSAL_COOLDOWN ({rev_remaining}s, was {rev_side})"
                     if self._tick_count % 12 == 0:
                         self.logger.info(
                             "[%s] REVERSAL COOLDOWN — exited %s %ds ago, blocking same-dir re-entry for %ds",
                             self.pair, rev_side,
-                            int(self.REVERSAL_COOLDOWN_SECONDS - rev_remaining),
-                            int(rev_remaining),
+                            self.REVERSAL_COOLDOWN_SECONDS - rev_remaining,
+                            rev_remaining,
                         )
                     self.last_signal_state = {
                         "side": side, "reason": reason,
                         "strength": signal_strength, "trend_15m": trend_15m,
                         "rsi": rsi_now, "momentum_60s": momentum_60s,
-                        "current_price": current_price, "timestamp": time.monotonic(),
+                        "current_price": current_price, "timestamp": now,
                         "skip_reason": self._skip_reason,
                         **self._last_signal_breakdown,
                     }
@@ -1067,7 +1349,7 @@ class ScalpStrategy(BaseStrategy):
 
             # ── PER-PAIR STRENGTH GATE: weak pairs need stronger signals ──
             # During warmup (first 5 min), accept 2/4 for all pairs incl BTC
-            in_warmup = (time.monotonic() - self._strategy_start_time) < self.WARMUP_SECONDS
+            in_warmup = (now - self._strategy_start_time) < self.WARMUP_SECONDS
             if in_warmup:
                 min_strength = self.WARMUP_MIN_STRENGTH
             else:
@@ -1084,7 +1366,7 @@ class ScalpStrategy(BaseStrategy):
                     "side": side, "reason": reason,
                     "strength": signal_strength, "trend_15m": trend_15m,
                     "rsi": rsi_now, "momentum_60s": momentum_60s,
-                    "current_price": current_price, "timestamp": time.monotonic(),
+                    "current_price": current_price, "timestamp": now,
                     "skip_reason": self._skip_reason,
                     **self._last_signal_breakdown,
                 }
@@ -1115,7 +1397,7 @@ class ScalpStrategy(BaseStrategy):
                 "rsi": rsi_now,
                 "momentum_60s": momentum_60s,
                 "current_price": current_price,
-                "timestamp": time.monotonic(),
+                "timestamp": now,
                 "skip_reason": "",
                 **self._last_signal_breakdown,
             }
@@ -1146,12 +1428,12 @@ class ScalpStrategy(BaseStrategy):
                 "rsi": rsi_now,
                 "momentum_60s": momentum_60s,
                 "current_price": current_price,
-                "timestamp": time.monotonic(),
+                "timestamp": now,
                 "skip_reason": self._skip_reason,
                 **self._last_signal_breakdown,
             }
             # Log scanning status every 30 seconds with pass/fail per condition
-            if self._tick_count % 6 == 0:
+            if self._tick_count % 6 == 0 and self.logger.isEnabledFor(logging.INFO):
                 eff_mom, eff_vol, eff_rsi_l, eff_rsi_s = self._effective_thresholds(is_widened)
 
                 # Build pass/fail indicators for each condition
@@ -1239,13 +1521,12 @@ class ScalpStrategy(BaseStrategy):
         bb_lower: float,
         trend_15m: str = "neutral",
         widened: bool = False,
-        df: pd.DataFrame | None = None,
+        candles: np.ndarray | None = None,
         vwap: float = 0.0,
         ema_9: float = 0.0,
         ema_21: float = 0.0,
         kc_upper: float = 0.0,
         kc_lower: float = 0.0,
-        rsi_series: "pd.Series | None" = None,
     ) -> tuple[str, str, bool, int] | None:
         """Detect quality momentum using 3-of-4 signals with setup tracking.
 
@@ -1327,179 +1608,83 @@ class ScalpStrategy(BaseStrategy):
             required_long = max(required_long, self.POST_STREAK_STRENGTH)
             required_short = max(required_short, self.POST_STREAK_STRENGTH)
 
-        self.logger.debug(
-            "[%s] MOM %s: %+.3f%% dir=%s req=L%d/S%d regime=%s gate=%s",
-            self.pair, mom_strength, momentum_60s, mom_direction,
-            required_long, required_short, self._market_regime,
-            "PASS" if not below_gate else "BLOCKED",
-        )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "[%s] MOM %s: %+.3f%% dir=%s req=L%d/S%d regime=%s gate=%s",
+                self.pair, mom_strength, momentum_60s, mom_direction,
+                required_long, required_short, self._market_regime,
+                "PASS" if not below_gate else "BLOCKED",
+            )
 
-        # ── Count bullish and bearish signals ──────────────────────────────
-        bull_signals: list[str] = []
-        bear_signals: list[str] = []
-
-        # 1. Momentum (60s move) — same threshold for both directions
-        if momentum_60s >= eff_mom:
-            bull_signals.append(f"MOM:{momentum_60s:+.2f}%")
-        if momentum_60s <= -eff_mom:
-            bear_signals.append(f"MOM:{momentum_60s:+.2f}%")
-
-        # 2. Volume spike — direction from candle
-        if vol_ratio >= eff_vol:
-            if momentum_60s > 0:
-                bull_signals.append(f"VOL:{vol_ratio:.1f}x")
-            elif momentum_60s < 0:
-                bear_signals.append(f"VOL:{vol_ratio:.1f}x")
-            else:
-                # Flat candle with volume — add to both, signal count decides
-                bull_signals.append(f"VOL:{vol_ratio:.1f}x")
-                bear_signals.append(f"VOL:{vol_ratio:.1f}x")
-
-        # 3. RSI extreme — same thresholds always
-        if rsi_now < eff_rsi_l:
-            bull_signals.append(f"RSI:{rsi_now:.0f}<{eff_rsi_l:.0f}")
-        if rsi_now > eff_rsi_s:
-            bear_signals.append(f"RSI:{rsi_now:.0f}>{eff_rsi_s:.0f}")
-
-        # 4. BB mean-reversion (ONE interpretation only):
-        #    Price near lower BB → long (oversold, expect bounce)
-        #    Price near upper BB → short (overbought, expect fade)
-        bb_range = bb_upper - bb_lower if bb_upper > bb_lower else 1.0
-        bb_position = (price - bb_lower) / bb_range  # 0.0 = lower, 1.0 = upper
-
-        if bb_position <= self.BB_MEAN_REVERT_LOWER:
-            bull_signals.append(f"BB:low@{bb_position:.0%}")
-        if bb_position >= self.BB_MEAN_REVERT_UPPER and can_short:
-            bear_signals.append(f"BB:high@{bb_position:.0%}")
-
-        # 5. Multi-timeframe momentum (5-min / 300s) — slow bleed detection
-        #    Catches moves that are too slow for 60s threshold but significant over 5m
-        if momentum_300s >= self.MOMENTUM_5M_MIN_PCT:
-            if f"MOM:" not in " ".join(bull_signals):  # don't double-count if 60s already fired
-                bull_signals.append(f"MOM5m:{momentum_300s:+.2f}%")
-        if momentum_300s <= -self.MOMENTUM_5M_MIN_PCT:
-            if f"MOM:" not in " ".join(bear_signals):
-                bear_signals.append(f"MOM5m:{momentum_300s:+.2f}%")
-
-        # 6. Trend continuation: new 15-candle low/high + volume > average
-        #    "Price making new lows with volume = sellers in control"
-        if df is not None and len(df) >= self.TREND_CONT_CANDLES + 1:
-            close_arr = df["close"].values
-            volume_arr = df["volume"].values
-            current_close = float(close_arr[-1])
-            lookback = close_arr[-(self.TREND_CONT_CANDLES + 1):-1]  # previous 15 candles
-            avg_vol = float(volume_arr[-(self.TREND_CONT_CANDLES + 1):-1].mean())
-            current_vol = float(volume_arr[-1])
-
-            # New low in last 15 candles + volume above average → SHORT signal
-            if current_close < float(lookback.min()) and current_vol >= avg_vol * self.TREND_CONT_VOL_RATIO:
-                if can_short:
-                    bear_signals.append(f"TCONT:newLow+vol{current_vol/avg_vol:.1f}x")
-
-            # New high in last 15 candles + volume above average → LONG signal
-            if current_close > float(lookback.max()) and current_vol >= avg_vol * self.TREND_CONT_VOL_RATIO:
-                bull_signals.append(f"TCONT:newHigh+vol{current_vol/avg_vol:.1f}x")
-
-        # 7. VWAP Reclaim + EMA ribbon alignment
-        #    Price above VWAP with bullish EMA ribbon → momentum confirmation for LONG
-        #    Price below VWAP with bearish EMA ribbon → momentum confirmation for SHORT
-        if vwap > 0 and ema_9 > 0 and ema_21 > 0:
-            if price > vwap and ema_9 > ema_21:
-                vwap_dist = (price - vwap) / vwap * 100
-                bull_signals.append(f"VWAP:above+EMA↑({vwap_dist:.2f}%)")
-            if price < vwap and ema_9 < ema_21 and can_short:
-                vwap_dist = (vwap - price) / vwap * 100
-                bear_signals.append(f"VWAP:below+EMA↓({vwap_dist:.2f}%)")
-
-        # 8. Bollinger Squeeze Breakout
-        #    BB inside Keltner Channel = squeeze (low volatility, coiling).
-        #    Price closing outside BB with volume spike = explosive breakout.
+        # ── Evaluate every signal as bits (jitted, no string work) ────────
+        # 8. Bollinger Squeeze state: BB inside Keltner Channel = squeeze
+        #    (low volatility, coiling); a breakout stays valid for 2 ticks.
+        squeeze_active = False
         if kc_upper > 0 and kc_lower > 0:
             bb_inside_kc = bb_upper < kc_upper and bb_lower > kc_lower
             if bb_inside_kc:
                 self._squeeze_tick_count = 2  # breakout valid for 2 ticks after squeeze
             elif self._squeeze_tick_count > 0:
                 self._squeeze_tick_count -= 1
+            squeeze_active = bb_inside_kc or self._squeeze_tick_count > 0
+
+        if candles is None:
+            candles = _EMPTY_CANDLES
+        bull_mask, bear_mask, tcont_vol_x, fvg_gap_pct, voldiv_drop_pct = signal_masks(
+            candles[:, COL_HIGH], candles[:, COL_LOW],
+            candles[:, COL_CLOSE], candles[:, COL_VOLUME],
+            price, momentum_60s, momentum_300s, vol_ratio, rsi_now,
+            bb_upper, bb_lower, vwap, ema_9, ema_21, squeeze_active,
+            eff_mom, eff_vol, eff_rsi_l, eff_rsi_s,
+            self.BB_MEAN_REVERT_LOWER, self.BB_MEAN_REVERT_UPPER,
+            self.MOMENTUM_5M_MIN_PCT, self.TREND_CONT_CANDLES,
+            self.TREND_CONT_VOL_RATIO, can_short,
+        )
 
-            if bb_inside_kc or self._squeeze_tick_count > 0:
-                if price > bb_upper and vol_ratio >= eff_vol:
-                    bull_signals.append(f"BBSQZ:breakout+vol{vol_ratio:.1f}x")
-                if price < bb_lower and vol_ratio >= eff_vol and can_short:
-                    bear_signals.append(f"BBSQZ:breakout+vol{vol_ratio:.1f}x")
-
-        # 9. Liquidity Sweep — DISABLED (poor performance: 134-contract SWEEP lost $0.82)
-        #    Was: Swing Failure Pattern + RSI divergence
-        #    if df is not None and len(df) >= 12 ...
-        if False:  # LIQSWEEP DISABLED — poor performance
-            pass
+        # ── ACTIVITY GATE: quiet tick → skip the decision cascade ──────────
+        # Most ticks nothing fires. An empty bull mask and bear mask imply
+        # momentum is below the gate (SIG_MOM would be set otherwise), so the
+        # outcome is already known: reuse the shared empty breakdown.
+        if not (bull_mask | bear_mask):
+            self._last_signal_breakdown = _QUIET_BREAKDOWN
+            self._skip_reason = f"NO_MOMENTUM ({mom_abs:.3f}% < {eff_mom:.3f}%)"
+            return None
 
-        # 10. Fair Value Gap (FVG) — price filling an imbalance gap
-        #     3-candle pattern: gap between candle A's high and candle C's low.
-        #     Price retracing into the gap = high-precision entry.
-        if df is not None and len(df) >= 5:
-            for i in range(-5, -2):
-                candle_a_high = float(df["high"].iloc[i])
-                candle_c_low = float(df["low"].iloc[i + 2])
-                candle_a_low = float(df["low"].iloc[i])
-                candle_c_high = float(df["high"].iloc[i + 2])
-
-                # Bullish FVG: candle C's low > candle A's high (gap up)
-                if candle_c_low > candle_a_high:
-                    gap_top = candle_c_low
-                    gap_bottom = candle_a_high
-                    gap_pct = (gap_top - gap_bottom) / gap_bottom * 100 if gap_bottom > 0 else 0
-                    if gap_bottom <= price <= gap_top and gap_pct >= 0.05:
-                        bull_signals.append(f"FVG:fill+{gap_pct:.2f}%")
-                        break
-
-                # Bearish FVG: candle C's high < candle A's low (gap down)
-                if candle_c_high < candle_a_low and can_short:
-                    gap_top = candle_a_low
-                    gap_bottom = candle_c_high
-                    gap_pct = (gap_top - gap_bottom) / gap_top * 100 if gap_top > 0 else 0
-                    if gap_bottom <= price <= gap_top and gap_pct >= 0.05:
-                        bear_signals.append(f"FVG:fill-{gap_pct:.2f}%")
-                        break
-
-        # 11. Volume Divergence — hollow moves detection
-        #     Rising price + declining volume = no new money behind the move.
-        if df is not None and len(df) >= 10:
-            recent_closes = df["close"].values[-5:]
-            older_closes = df["close"].values[-10:-5]
-            recent_vol = float(df["volume"].values[-5:].mean())
-            older_vol = float(df["volume"].values[-10:-5].mean())
-
-            price_rising = float(recent_closes[-1]) > float(older_closes[-1])
-            price_falling = float(recent_closes[-1]) < float(older_closes[-1])
-            vol_declining = older_vol > 0 and recent_vol < older_vol * 0.8  # 20%+ drop
-
-            # Bearish: price up but volume dying = hollow pump
-            if price_rising and vol_declining and can_short:
-                vol_drop = (1 - recent_vol / older_vol) * 100 if older_vol > 0 else 0
-                bear_signals.append(f"VOLDIV:price↑vol↓{vol_drop:.0f}%")
-
-            # Bullish: price down but volume dying = exhausted sellers
-            if price_falling and vol_declining:
-                vol_drop = (1 - recent_vol / older_vol) * 100 if older_vol > 0 else 0
-                bull_signals.append(f"VOLDIV:price↓vol↓{vol_drop:.0f}%")
+        bull_count = bull_mask.bit_count()
+        bear_count = bear_mask.bit_count()
+
+        def _signal_tags(mask: int, bull: bool) -> list[str]:
+            """Format the reason tags for a fired mask — entry paths only."""
+            bb_range = bb_upper - bb_lower if bb_upper > bb_lower else 1.0
+            vwap_dist = (price - vwap) / vwap * 100 if vwap > 0 else 0.0
+            return _format_reason(mask, bull, {
+                "mom": momentum_60s, "mom_5m": momentum_300s, "vol": vol_ratio,
+                "rsi": rsi_now, "rsi_l": eff_rsi_l, "rsi_s": eff_rsi_s,
+                "bb_pos": (price - bb_lower) / bb_range,
+                "tcont_vol": tcont_vol_x, "vwap_dist": vwap_dist, "vwap_dist_neg": -vwap_dist,
+                "fvg_gap": fvg_gap_pct, "voldiv_drop": voldiv_drop_pct,
+            })
 
         # ── Build directional signal breakdown for dashboard ────────────────
         # Stored on self so last_signal_state can spread it in evaluate().
+        # Signal lists carry bare names — values are formatted only on entry.
         def _build_breakdown() -> dict[str, Any]:
             return {
-                "bull_count": len(bull_signals),
-                "bear_count": len(bear_signals),
-                "bull_signals": list(bull_signals),
-                "bear_signals": list(bear_signals),
+                "bull_count": bull_count,
+                "bear_count": bear_count,
+                "bull_mask": bull_mask,
+                "bear_mask": bear_mask,
+                "bull_signals": _signal_names(bull_mask),
+                "bear_signals": _signal_names(bear_mask),
                 # Core-4 directional booleans (dashboard dots)
-                "bull_mom": any(s.startswith(("MOM:", "MOM5m:")) for s in bull_signals),
-                "bull_vol": any(s.startswith("VOL:") for s in bull_signals),
-                "bull_rsi": any(s.startswith("RSI:") for s in bull_signals),
-                "bull_bb": any(s.startswith(("BB:", "BBSQZ:")) for s in bull_signals),
-                "bear_mom": any(s.startswith(("MOM:", "MOM5m:")) for s in bear_signals),
-                "bear_vol": any(s.startswith("VOL:") for s in bear_signals),
-                "bear_rsi": any(s.startswith("RSI:") for s in bear_signals),
-                "bear_bb": any(s.startswith(("BB:", "BBSQZ:")) for s in bear_signals),
+                "bull_mom": bool(bull_mask & (SIG_MOM | SIG_MOM5M)),
+                "bull_vol": bool(bull_mask & SIG_VOL),
+                "bull_rsi": bool(bull_mask & SIG_RSI),
+                "bull_bb": bool(bull_mask & (SIG_BB | SIG_BBSQZ)),
+                "bear_mom": bool(bear_mask & (SIG_MOM | SIG_MOM5M)),
+                "bear_vol": bool(bear_mask & SIG_VOL),
+                "bear_rsi": bool(bear_mask & SIG_RSI),
+                "bear_bb": bool(bear_mask & (SIG_BB | SIG_BBSQZ)),
             }
 
         # ══════════════════════════════════════════════════════════════
@@ -1531,48 +1716,49 @@ class ScalpStrategy(BaseStrategy):
         if rsi_now < self.RSI_OVERRIDE_LONG and mom_direction == "long":
             reason = f"LONG RSI-OVERRIDE: RSI={rsi_now:.1f}<{self.RSI_OVERRIDE_LONG} [15m={trend_15m}]{widen_tag}"
             # Add any existing bull signals for context
-            if bull_signals:
-                reason += f" +{'+'.join(bull_signals)}"
-            strength = max(len(bull_signals), 2)  # at least 2/4 equivalent
+            if bull_mask:
+                reason += f" +{'+'.join(_signal_tags(bull_mask, True))}"
+            strength = max(bull_count, 2)  # at least 2/4 equivalent
             self._last_signal_breakdown = _build_breakdown()
             return ("long", reason, True, strength)
 
         if rsi_now > self.RSI_OVERRIDE_SHORT and can_short and mom_direction == "short":
             reason = f"SHORT RSI-OVERRIDE: RSI={rsi_now:.1f}>{self.RSI_OVERRIDE_SHORT} [15m={trend_15m}]{widen_tag}"
-            if bear_signals:
-                reason += f" +{'+'.join(bear_signals)}"
-            strength = max(len(bear_signals), 2)
+            if bear_mask:
+                reason += f" +{'+'.join(_signal_tags(bear_mask, False))}"
+            strength = max(bear_count, 2)
             self._last_signal_breakdown = _build_breakdown()
             return ("short", reason, True, strength)
 
         # ── Check required signals (LONG) — trend-weighted ────────────────
         # NO fee filter — if 2/4 signals fire, ENTER. The signal system IS the filter.
         # RSI + VOL is a valid entry even when momentum is flat (price about to move).
-        if len(bull_signals) >= required_long and mom_direction == "long":
+        # Limit order unless the leading (lowest) signal bit is a momentum one.
+        if bull_count >= required_long and mom_direction == "long":
             req_tag = f" req={required_long}/4" if required_long > 2 else ""
-            reason = f"LONG {len(bull_signals)}/4: {' + '.join(bull_signals)} [15m={trend_15m}]{req_tag}{widen_tag}"
-            use_limit = "MOM" not in bull_signals[0]
+            reason = f"LONG {bull_count}/4: {' + '.join(_signal_tags(bull_mask, True))} [15m={trend_15m}]{req_tag}{widen_tag}"
+            use_limit = not (bull_mask & -bull_mask) & (SIG_MOM | SIG_MOM5M)
             self._last_signal_breakdown = _build_breakdown()
-            return ("long", reason, use_limit, len(bull_signals))
+            return ("long", reason, use_limit, bull_count)
 
         # ── Check required signals (SHORT) — trend-weighted ───────────────
-        if len(bear_signals) >= required_short and can_short and mom_direction == "short":
+        if bear_count >= required_short and can_short and mom_direction == "short":
             req_tag = f" req={required_short}/4" if required_short > 2 else ""
-            reason = f"SHORT {len(bear_signals)}/4: {' + '.join(bear_signals)} [15m={trend_15m}]{req_tag}{widen_tag}"
-            use_limit = "MOM" not in bear_signals[0]
+            reason = f"SHORT {bear_count}/4: {' + '.join(_signal_tags(bear_mask, False))} [15m={trend_15m}]{req_tag}{widen_tag}"
+            use_limit = not (bear_mask & -bear_mask) & (SIG_MOM | SIG_MOM5M)
             self._last_signal_breakdown = _build_breakdown()
-            return ("short", reason, use_limit, len(bear_signals))
+            return ("short", reason, use_limit, bear_count)
 
         # ── Log direction-blocked entries ────────────────────────────────
-        if len(bull_signals) >= required_long and mom_direction != "long":
+        if bull_count >= required_long and mom_direction != "long":
             self.logger.info(
                 "[%s] DIRECTION BLOCK: %d bull signals but mom is %+.3f%% (%s)",
-                self.pair, len(bull_signals), momentum_60s, mom_direction,
+                self.pair, bull_count, momentum_60s, mom_direction,
             )
-        if len(bear_signals) >= required_short and mom_direction != "short":
+        if bear_count >= required_short and mom_direction != "short":
             self.logger.info(
                 "[%s] DIRECTION BLOCK: %d bear signals but mom is %+.3f%% (%s)",
-                self.pair, len(bear_signals), momentum_60s, mom_direction,
+                self.pair, bear_count, momentum_60s, mom_direction,
             )
 
         self._last_signal_breakdown = _build_breakdown()
@@ -1616,11 +1802,11 @@ class ScalpStrategy(BaseStrategy):
             return  # spot uses pullback system, not trail tiers
 
         peak_pnl = self._peak_unrealized_pnl
-        side = self.position_side or "long"
+        side_code = self.position_side_code or SIDE_LONG
 
         # Find best matching tier (iterate reversed = highest first)
         new_dist: float | None = None
-        for min_peak, trail_dist in reversed(self.TRAIL_TIER_TABLE):
+        for min_peak, trail_dist, long_mult, short_mult in self._TRAIL_TIERS_DESC:
             if peak_pnl >= min_peak:
                 new_dist = trail_dist
                 break
@@ -1629,9 +1815,9 @@ class ScalpStrategy(BaseStrategy):
             return  # peak hasn't reached first tier yet
 
         # Compute trail stop from peak PRICE (not entry)
-        if side == "long":
+        if side_code == SIDE_LONG:
             peak_price = self.highest_since_entry
-            candidate = peak_price * (1 - new_dist / 100)
+            candidate = peak_price * long_mult
             # Trail stop only moves UP for longs
             if candidate > self._trail_stop_price:
                 old_stop = self._trail_stop_price
@@ -1654,7 +1840,7 @@ class ScalpStrategy(BaseStrategy):
                     )
         else:  # short
             peak_price = self.lowest_since_entry
-            candidate = peak_price * (1 + new_dist / 100)
+            candidate = peak_price * short_mult
             # Trail stop only moves DOWN for shorts
             if self._trail_stop_price == 0 or candidate < self._trail_stop_price:
                 old_stop = self._trail_stop_price
@@ -1676,7 +1862,21 @@ class ScalpStrategy(BaseStrategy):
                         peak_pnl, new_dist,
                     )
 
-    def _check_exits(self, current_price: float, rsi_now: float, momentum_60s: float) -> list[Signal]:
+    def _check_exits(
+        self, current_price: float, rsi_now: float, momentum_60s: float, now: float,
+    ) -> list[Signal]:
+        """Run the exit decision; build the exit Signal only when one fires."""
+        decision = self._evaluate_exit(current_price, rsi_now, momentum_60s, now)
+        if decision is None:
+            return []
+        return self._do_exit(
+            current_price, decision.pnl_pct, _SIDE_TO_STR[self.position_side_code or SIDE_LONG],
+            decision.exit_type, now - self.entry_time,
+        )
+
+    def _evaluate_exit(
+        self, current_price: float, rsi_now: float, momentum_60s: float, now: float,
+    ) -> ExitDecision | None:
         """MOMENTUM RIDING EXIT SYSTEM — ride momentum, exit on reversal.
 
         ALWAYS: Hard SL, Hard TP at 10%, ratchet floor.
@@ -1686,48 +1886,56 @@ class ScalpStrategy(BaseStrategy):
           MODE 1 — MOMENTUM RIDING: while momentum aligned, stay in. Wide ratchet floor.
           MODE 2 — SIGNAL REVERSAL: momentum flips, RSI extreme, or momentum dying → exit immediately.
         PHASE 3 (10-30 min): flatline/timeout only close losers.
+
+        Updates peak / trail / floor tracking; returns the exit to take, or None.
         """
-        signals: list[Signal] = []
-        hold_seconds = time.monotonic() - self.entry_time
+        hold_seconds = now - self.entry_time
         pnl_pct = self._calc_pnl_pct(current_price)
-        side = self.position_side or "long"
+        side_code = self.position_side_code or SIDE_LONG
+        side = _SIDE_TO_STR[side_code]
+        entry_price = self.entry_price
 
-        # Track peaks
-        self._peak_unrealized_pnl = max(self._peak_unrealized_pnl, pnl_pct)
-        if side == "long":
-            self.highest_since_entry = max(self.highest_since_entry, current_price)
-        else:
-            self.lowest_since_entry = min(self.lowest_since_entry, current_price)
+        # Track peaks — stored only when a new extreme is set
+        peak = self._peak_unrealized_pnl
+        if pnl_pct > peak:
+            peak = pnl_pct
+            self._peak_unrealized_pnl = peak
+        if side_code == SIDE_LONG:
+            if current_price > self.highest_since_entry:
+                self.highest_since_entry = current_price
+        elif current_price < self.lowest_since_entry:
+            self.lowest_since_entry = current_price
 
         # Update trailing stop tiers (moves trail_stop_price up for longs)
         self._update_trail_stop()
+        trail_stop = self._trail_stop_price
 
         # ══════════════════════════════════════════════════════════════
         # ALWAYS: Hard SL + Trail Stop — fires in ALL phases
         # Trail stop overrides hard SL when tighter (only moves toward price)
         # ══════════════════════════════════════════════════════════════
-        if side == "long":
-            hard_sl = self.entry_price * (1 - self._sl_pct / 100)
-            sl_price = max(hard_sl, self._trail_stop_price) if self._trail_stop_price > 0 else hard_sl
+        if side_code == SIDE_LONG:
+            hard_sl = entry_price * self._sl_mult_long
+            sl_price = max(hard_sl, trail_stop) if trail_stop > 0 else hard_sl
             if current_price <= sl_price:
                 exit_label = "TRAIL" if self._trailing_active and sl_price > hard_sl else "SL"
                 self.logger.info(
                     "[%s] %s HIT pnl=%+.2f%% (sl=$%.2f trail=$%.2f) — %ds in",
                     self.pair, exit_label, pnl_pct, sl_price,
-                    self._trail_stop_price, int(hold_seconds),
+                    trail_stop, int(hold_seconds),
                 )
-                return self._do_exit(current_price, pnl_pct, side, exit_label, hold_seconds)
+                return ExitDecision(exit_label, pnl_pct)
         else:
-            hard_sl = self.entry_price * (1 + self._sl_pct / 100)
-            sl_price = min(hard_sl, self._trail_stop_price) if self._trail_stop_price > 0 else hard_sl
+            hard_sl = entry_price * self._sl_mult_short
+            sl_price = min(hard_sl, trail_stop) if trail_stop > 0 else hard_sl
             if current_price >= sl_price:
                 exit_label = "TRAIL" if self._trailing_active and sl_price < hard_sl else "SL"
                 self.logger.info(
                     "[%s] %s HIT pnl=%+.2f%% (sl=$%.2f trail=$%.2f) — %ds in",
                     self.pair, exit_label, pnl_pct, sl_price,
-                    self._trail_stop_price, int(hold_seconds),
+                    trail_stop, int(hold_seconds),
                 )
-                return self._do_exit(current_price, pnl_pct, side, exit_label, hold_seconds)
+                return ExitDecision(exit_label, pnl_pct)
 
         # ══════════════════════════════════════════════════════════════
         # ALWAYS: Hard TP — 10% capital safety net
@@ -1738,29 +1946,29 @@ class ScalpStrategy(BaseStrategy):
                 "[%s] HARD TP HIT — capital +%.1f%% (price +%.2f%% × %dx) — %ds in",
                 self.pair, capital_pnl, pnl_pct, self.leverage, int(hold_seconds),
             )
-            return self._do_exit(current_price, pnl_pct, side, "HARD_TP_10PCT", hold_seconds)
+            return ExitDecision("HARD_TP_10PCT", pnl_pct)
 
         # ══════════════════════════════════════════════════════════════
         # ALWAYS: Ratchet floor — based on PnL % (not capital %)
         # Floor only moves UP. If current PnL drops below floor → EXIT.
         # ══════════════════════════════════════════════════════════════
-        self._update_ratchet_floor()
-        if self._profit_floor_pct > -999 and pnl_pct < self._profit_floor_pct:
+        floor = self._update_ratchet_floor()
+        if floor > -999 and pnl_pct < floor:
             self.logger.info(
                 "FLOOR_EXIT: %s pnl=+%.2f%% hit floor +%.2f%% — locking profit",
-                self.pair, pnl_pct, self._profit_floor_pct,
+                self.pair, pnl_pct, floor,
             )
-            return self._do_exit(current_price, pnl_pct, side, "RATCHET", hold_seconds)
+            return ExitDecision("RATCHET", pnl_pct)
 
         # ══════════════════════════════════════════════════════════════
         # PHASE 1 (0-30s): HANDS OFF — only SL/TP/floor above
         # EXCEPTION: if peak PnL >= +0.5%, skip to Phase 2 immediately
         # ══════════════════════════════════════════════════════════════
         if hold_seconds < self.PHASE1_SECONDS:
-            if self._peak_unrealized_pnl >= self.PHASE1_SKIP_AT_PEAK_PCT:
+            if peak >= self.PHASE1_SKIP_AT_PEAK_PCT:
                 self.logger.info(
                     "[%s] PHASE1 SKIP — peak +%.2f%% >= +%.1f%%, entering Phase 2 at %ds",
-                    self.pair, self._peak_unrealized_pnl,
+                    self.pair, peak,
                     self.PHASE1_SKIP_AT_PEAK_PCT, int(hold_seconds),
                 )
             else:
@@ -1768,16 +1976,16 @@ class ScalpStrategy(BaseStrategy):
                     self.logger.info(
                         "[%s] PHASE1 %ds/%ds | %s $%.2f | PnL=%+.2f%% | peak=%+.2f%%",
                         self.pair, int(hold_seconds), self.PHASE1_SECONDS,
-                        side, current_price, pnl_pct, self._peak_unrealized_pnl,
+                        side, current_price, pnl_pct, peak,
                     )
-                return signals
+                return None
 
         # ══════════════════════════════════════════════════════════════
         # PHASE 2+: MOMENTUM RIDING EXIT SYSTEM (futures)
         # ══════════════════════════════════════════════════════════════
         if self.is_futures:
             # ── Check momentum alignment ──────────────────────────────
-            if side == "long":
+            if side_code == SIDE_LONG:
                 momentum_aligned = momentum_60s > 0
             else:
                 momentum_aligned = momentum_60s < 0
@@ -1788,106 +1996,106 @@ class ScalpStrategy(BaseStrategy):
                 if self._tick_count % 12 == 0:
                     self.logger.info(
                         "RIDING: %s peak=+%.2f%% floor=+%.2f%% mom=%.3f%% — momentum aligned",
-                        self.pair, self._peak_unrealized_pnl,
-                        self._profit_floor_pct if self._profit_floor_pct > -999 else 0,
+                        self.pair, peak,
+                        floor if floor > -999 else 0,
                         momentum_60s,
                     )
                 # Breakeven safety: if peak was high but we're back near entry
-                if self._peak_unrealized_pnl >= self.MOVE_SL_TO_ENTRY_PCT:
+                if peak >= self.MOVE_SL_TO_ENTRY_PCT:
                     fee_adj = config.delta.mixed_round_trip
-                    if side == "long":
-                        be_price = self.entry_price * (1 + fee_adj)
+                    if side_code == SIDE_LONG:
+                        be_price = entry_price * (1 + fee_adj)
                         at_be = current_price <= be_price
                     else:
-                        be_price = self.entry_price * (1 - fee_adj)
+                        be_price = entry_price * (1 - fee_adj)
                         at_be = current_price >= be_price
                     if at_be:
-                        return self._do_exit(current_price, pnl_pct, side, "BREAKEVEN", hold_seconds)
-                return signals  # STAY IN — momentum still aligned
+                        return ExitDecision("BREAKEVEN", pnl_pct)
+                return None  # STAY IN — momentum still aligned
 
             # ── MODE 2: SIGNAL REVERSAL EXIT (last resort, not default) ─
             # Ratchet floor is the primary profit protector.
             # Reversal only fires on CONFIRMED momentum death.
-            reversal_reason = ""
+            reversal = _REV_NONE
+            flip_dur = 0
 
             # Check 1: momentum flipped sign — needs 15s confirmation
-            mom_flipped = (side == "long" and momentum_60s < 0) or \
-                          (side == "short" and momentum_60s > 0)
+            mom_flipped = momentum_60s * side_code < 0  # momentum against position
             if mom_flipped:
                 if self._mom_flip_since == 0:
                     # First detection — start timer
-                    self._mom_flip_since = time.monotonic()
+                    self._mom_flip_since = now
                     self.logger.info(
                         "MOM_FLIP_START: %s mom=%.3f%% — confirming for %ds",
                         self.pair, momentum_60s, self.MOM_FLIP_CONFIRM_SECONDS,
                     )
-                elif time.monotonic() - self._mom_flip_since >= self.MOM_FLIP_CONFIRM_SECONDS:
+                elif now - self._mom_flip_since >= self.MOM_FLIP_CONFIRM_SECONDS:
                     # Confirmed — momentum stayed flipped for 15s+
-                    flip_dur = int(time.monotonic() - self._mom_flip_since)
-                    reversal_reason = f"mom_flip_confirmed ({momentum_60s:+.3f}%, {flip_dur}s)"
+                    flip_dur = int(now - self._mom_flip_since)
+                    reversal = _REV_MOM_FLIP
             else:
                 # Momentum re-aligned — reset timer and clear reversal log flag
                 if self._mom_flip_since > 0:
                     self.logger.info(
                         "MOM_FLIP_RESET: %s mom=%.3f%% re-aligned after %.0fs — false alarm",
-                        self.pair, momentum_60s, time.monotonic() - self._mom_flip_since,
+                        self.pair, momentum_60s, now - self._mom_flip_since,
                     )
                 self._mom_flip_since = 0.0
                 self._reversal_exit_logged = False  # allow fresh log if it flips again
 
             # Check 2: momentum dying (below 0.02% absolute — truly dead)
-            if not reversal_reason and abs(momentum_60s) < self.MOMENTUM_DYING_PCT:
-                reversal_reason = f"mom_dying ({abs(momentum_60s):.3f}% < {self.MOMENTUM_DYING_PCT}%)"
+            if not reversal and abs(momentum_60s) < self.MOMENTUM_DYING_PCT:
+                reversal = _REV_MOM_DYING
 
             # RSI cross REMOVED as reversal trigger for futures.
             # RSI crossing 70 in a long is trend strength, not reversal.
             # Ratchet floor handles profit protection.
 
             # If confirmed reversal AND in profit → exit
-            if reversal_reason and pnl_pct >= self.REVERSAL_MIN_PROFIT_PCT:
+            if reversal and pnl_pct >= self.REVERSAL_MIN_PROFIT_PCT:
                 if not self._reversal_exit_logged:
                     self._reversal_exit_logged = True
                     self.logger.info(
                         "REVERSAL_DETECTED: %s peak=+%.2f%% pnl=%+.2f%% mom=%.3f%% — "
                         "attempting exit (%s)",
-                        self.pair, self._peak_unrealized_pnl, pnl_pct,
-                        momentum_60s, reversal_reason,
+                        self.pair, peak, pnl_pct,
+                        momentum_60s, self._reversal_reason(reversal, momentum_60s, flip_dur),
                     )
-                return self._do_exit(current_price, pnl_pct, side, "REVERSAL", hold_seconds)
+                return ExitDecision("REVERSAL", pnl_pct)
 
             # If reversal signal but NOT in profit — check breakeven
-            if reversal_reason and self._peak_unrealized_pnl >= self.MOVE_SL_TO_ENTRY_PCT:
+            if reversal and peak >= self.MOVE_SL_TO_ENTRY_PCT:
                 fee_adj = config.delta.mixed_round_trip
-                if side == "long":
-                    be_price = self.entry_price * (1 + fee_adj)
+                if side_code == SIDE_LONG:
+                    be_price = entry_price * (1 + fee_adj)
                     at_be = current_price <= be_price
                 else:
-                    be_price = self.entry_price * (1 - fee_adj)
+                    be_price = entry_price * (1 - fee_adj)
                     at_be = current_price >= be_price
                 if at_be:
-                    return self._do_exit(current_price, pnl_pct, side, "BREAKEVEN", hold_seconds)
+                    return ExitDecision("BREAKEVEN", pnl_pct)
 
             # Log reversal pending once (suppresses spam while waiting)
-            if reversal_reason and not self._reversal_exit_logged:
+            if reversal and not self._reversal_exit_logged:
                 self._reversal_exit_logged = True
                 self.logger.info(
                     "REVERSAL_PENDING: %s pnl=%+.2f%% (need +%.2f%% for exit) — %s",
-                    self.pair, pnl_pct, self.REVERSAL_MIN_PROFIT_PCT, reversal_reason,
+                    self.pair, pnl_pct, self.REVERSAL_MIN_PROFIT_PCT,
+                    self._reversal_reason(reversal, momentum_60s, flip_dur),
                 )
 
         else:
             # ── SPOT PROFIT PROTECTION (unchanged) ────────────────────
             if pnl_pct > 0:
-                peak = self._peak_unrealized_pnl
                 if peak >= self.SPOT_PULLBACK_MIN_PEAK_PCT:
                     if pnl_pct < peak * self.SPOT_PULLBACK_RATIO:
-                        return self._do_exit(current_price, pnl_pct, side, "SPOT_PULLBACK", hold_seconds)
+                        return ExitDecision("SPOT_PULLBACK", pnl_pct)
                 if peak >= self.SPOT_DECAY_MIN_PEAK_PCT:
                     if pnl_pct < self.SPOT_DECAY_EXIT_BELOW_PCT:
-                        return self._do_exit(current_price, pnl_pct, side, "SPOT_DECAY", hold_seconds)
+                        return ExitDecision("SPOT_DECAY", pnl_pct)
                 if peak >= self.SPOT_BREAKEVEN_MIN_PEAK_PCT:
                     if pnl_pct <= self.SPOT_BREAKEVEN_EXIT_BELOW_PCT:
-                        return self._do_exit(current_price, pnl_pct, side, "SPOT_BREAKEVEN", hold_seconds)
+                        return ExitDecision("SPOT_BREAKEVEN", pnl_pct)
 
         # ══════════════════════════════════════════════════════════════
         # PHASE 3 (10-30 min): FLATLINE / TIMEOUT — only close losers
@@ -1896,17 +2104,23 @@ class ScalpStrategy(BaseStrategy):
             # Flatline — 10 min with no movement — ONLY close losers
             if (hold_seconds >= self.FLATLINE_SECONDS
                     and abs(pnl_pct) < self.FLATLINE_MIN_MOVE_PCT and pnl_pct <= 0):
-                return self._do_exit(current_price, pnl_pct, side, "FLAT", hold_seconds)
+                return ExitDecision("FLAT", pnl_pct)
 
             # Hard timeout — ONLY close losers
             if hold_seconds >= self.MAX_HOLD_SECONDS and pnl_pct <= 0:
-                return self._do_exit(current_price, pnl_pct, side, "TIMEOUT", hold_seconds)
+                return ExitDecision("TIMEOUT", pnl_pct)
 
             # Safety: past timeout AND losing
             if hold_seconds >= self.MAX_HOLD_SECONDS and pnl_pct < 0:
-                return self._do_exit(current_price, pnl_pct, side, "SAFETY", hold_seconds)
+                return ExitDecision("SAFETY", pnl_pct)
 
-        return signals
+        return None
+
+    def _reversal_reason(self, reversal: int, momentum_60s: float, flip_dur: int) -> str:
+        """Human-readable reversal trigger — formatted only for the log lines."""
+        if reversal == _REV_MOM_FLIP:
+            return f"mom_flip_confirmed ({momentum_60s:+.3f}%, {flip_dur}s)"
+        return f"mom_dying ({abs(momentum_60s):.3f}% < {self.MOMENTUM_DYING_PCT}%)"
 
     def check_exits_immediate(self, current_price: float) -> None:
         """Price-only exit check — called by WebSocket PriceFeed on every tick.
@@ -1915,22 +2129,30 @@ class ScalpStrategy(BaseStrategy):
         Does NOT check momentum reversal (needs OHLCV data).
         Ratchet floor protects profits on every tick.
         """
-        if not self.in_position or not self.position_side:
+        side_code = self.position_side_code
+        if not self.in_position or not side_code:
             return
 
-        hold_seconds = time.monotonic() - self.entry_time
+        now_mono = time.monotonic()
+        hold_seconds = now_mono - self.entry_time
         pnl_pct = self._calc_pnl_pct(current_price)
-        side = self.position_side
+        side = _SIDE_TO_STR[side_code]
+        entry_price = self.entry_price
 
-        # Update peak tracking
-        self._peak_unrealized_pnl = max(self._peak_unrealized_pnl, pnl_pct)
-        if side == "long":
-            self.highest_since_entry = max(self.highest_since_entry, current_price)
-        else:
-            self.lowest_since_entry = min(self.lowest_since_entry, current_price)
+        # Update peak tracking — stored only when a new extreme is set
+        peak = self._peak_unrealized_pnl
+        if pnl_pct > peak:
+            peak = pnl_pct
+            self._peak_unrealized_pnl = peak
+        if side_code == SIDE_LONG:
+            if current_price > self.highest_since_entry:
+                self.highest_since_entry = current_price
+        elif current_price < self.lowest_since_entry:
+            self.lowest_since_entry = current_price
 
         # Update trailing stop tiers on every WS tick
         self._update_trail_stop()
+        trail_stop = self._trail_stop_price
 
         # Update live P&L for class-level tracker
         ScalpStrategy._live_pnl[self.pair] = pnl_pct
@@ -1938,21 +2160,21 @@ class ScalpStrategy(BaseStrategy):
         exit_type: str | None = None
 
         # ── ALWAYS: Hard SL + Trail Stop ──────────────────────────────
-        if side == "long":
-            hard_sl = self.entry_price * (1 - self._sl_pct / 100)
-            sl_price = max(hard_sl, self._trail_stop_price) if self._trail_stop_price > 0 else hard_sl
+        if side_code == SIDE_LONG:
+            hard_sl = entry_price * self._sl_mult_long
+            sl_price = max(hard_sl, trail_stop) if trail_stop > 0 else hard_sl
             if current_price <= sl_price:
                 exit_type = "TRAIL" if self._trailing_active and sl_price > hard_sl else "SL"
-        elif side == "short":
-            hard_sl = self.entry_price * (1 + self._sl_pct / 100)
-            sl_price = min(hard_sl, self._trail_stop_price) if self._trail_stop_price > 0 else hard_sl
+        elif side_code == SIDE_SHORT:
+            hard_sl = entry_price * self._sl_mult_short
+            sl_price = min(hard_sl, trail_stop) if trail_stop > 0 else hard_sl
             if current_price >= sl_price:
                 exit_type = "TRAIL" if self._trailing_active and sl_price < hard_sl else "SL"
 
         # ── ALWAYS: Ratchet floor (PnL-based, not capital-based) ─────
         if not exit_type:
-            self._update_ratchet_floor()
-            if self._profit_floor_pct > -999 and pnl_pct < self._profit_floor_pct:
+            floor = self._update_ratchet_floor()
+            if floor > -999 and pnl_pct < floor:
                 exit_type = "RATCHET"
 
         # ── ALWAYS: Hard TP ──────────────────────────────────────────
@@ -1961,16 +2183,15 @@ class ScalpStrategy(BaseStrategy):
             exit_type = "HARD_TP_10PCT"
 
         # Periodic logging (every 10s) for visibility
-        now_mono = time.monotonic()
-        if now_mono - self._last_ws_sl_log >= 10:
+        if now_mono - self._last_ws_sl_log >= 10 and self.logger.isEnabledFor(logging.INFO):
             self._last_ws_sl_log = now_mono
             floor_info = f" Floor=+{self._profit_floor_pct:.2f}%" if self._profit_floor_pct > -999 else ""
-            trail_info = f" Trail=$%.2f(%.2f%%)" % (self._trail_stop_price, self._trail_distance_pct) if self._trailing_active else ""
+            trail_info = f" Trail=$%.2f(%.2f%%)" % (trail_stop, self._trail_distance_pct) if self._trailing_active else ""
             self.logger.info(
                 "[%s] WS TICK: %s @ $%.2f PnL=%+.2f%% (%+.1f%%cap) peak=%+.2f%% "
                 "SL=$%.2f(%.2f%%) hold=%ds%s%s%s",
                 self.pair, side, current_price, pnl_pct, capital_pnl,
-                self._peak_unrealized_pnl, sl_price, self._sl_pct,
+                peak, sl_price, self._sl_pct,
                 int(hold_seconds),
                 floor_info, trail_info,
                 " -> " + exit_type + "!" if exit_type else "",
@@ -1979,27 +2200,26 @@ class ScalpStrategy(BaseStrategy):
         # ── PHASE 1: only hard exits fire ────────────────────────────
         _in_phase2_plus = hold_seconds >= self.PHASE1_SECONDS
         if not exit_type and not _in_phase2_plus:
-            if self._peak_unrealized_pnl >= self.PHASE1_SKIP_AT_PEAK_PCT:
+            if peak >= self.PHASE1_SKIP_AT_PEAK_PCT:
                 _in_phase2_plus = True
             else:
                 return  # hands off
 
         # ── PHASE 2+: breakeven (peaked high but returned to entry) ──
         if not exit_type and _in_phase2_plus:
-            if self._peak_unrealized_pnl >= self.MOVE_SL_TO_ENTRY_PCT:
+            if peak >= self.MOVE_SL_TO_ENTRY_PCT:
                 fee_adj = config.delta.mixed_round_trip
-                if side == "long":
-                    be_price = self.entry_price * (1 + fee_adj)
+                if side_code == SIDE_LONG:
+                    be_price = entry_price * (1 + fee_adj)
                     at_be = current_price <= be_price
                 else:
-                    be_price = self.entry_price * (1 - fee_adj)
+                    be_price = entry_price * (1 - fee_adj)
                     at_be = current_price >= be_price
                 if at_be:
                     exit_type = "BREAKEVEN"
 
         # ── PHASE 2+: SPOT PROFIT PROTECTION (spot only) ────────────
         if not exit_type and _in_phase2_plus and not self.is_futures and pnl_pct > 0:
-            peak = self._peak_unrealized_pnl
             if peak >= self.SPOT_PULLBACK_MIN_PEAK_PCT:
                 if pnl_pct < peak * self.SPOT_PULLBACK_RATIO:
                     exit_type = "SPOT_PULLBACK"
@@ -2055,8 +2275,6 @@ class ScalpStrategy(BaseStrategy):
         # Fee-aware minimum — skip tiny exits that'd be eaten by fees
         # Fee minimum only applies to discretionary exits, NOT protective exits.
         # TRAIL/BREAKEVEN/RATCHET protect profit — blocking them turns winners into losers.
-        _PROTECTED_EXIT_TYPES = {"SL", "TRAIL", "BREAKEVEN", "PROFIT_LOCK",
-                                 "HARD_TP", "HARD_TP_10PCT", "RATCHET", "SAFETY"}
         clean_type = exit_type.replace("WS-", "")
         if clean_type not in _PROTECTED_EXIT_TYPES and self.entry_price > 0:
             if self.is_futures:
@@ -2078,7 +2296,8 @@ class ScalpStrategy(BaseStrategy):
             f"Scalp {exit_type} {pnl_pct:+.2f}% price "
             f"({cap_pct:+.1f}% capital at {self.leverage}x)"
         )
-        # Compute peak P&L BEFORE _record_scalp_result resets entry_price/highest/lowest
+        # Capture amount and peak P&L BEFORE _record_scalp_result resets the position
+        amount = self.entry_amount
         if side == "long" and self.entry_price > 0:
             peak_pnl = ((self.highest_since_entry - self.entry_price) / self.entry_price) * 100
         elif side == "short" and self.entry_price > 0:
@@ -2086,15 +2305,15 @@ class ScalpStrategy(BaseStrategy):
         else:
             peak_pnl = 0.0
         self._record_scalp_result(pnl_pct, exit_type.lower())
-        return [self._exit_signal(price, side, reason, peak_pnl)]
+        return [self._exit_signal(price, side, reason, peak_pnl, amount)]
 
     def _calc_pnl_pct(self, current_price: float) -> float:
         """Calculate unrealized P&L percentage."""
         if self.entry_price <= 0:
             return 0.0
-        if self.position_side == "long":
+        if self.position_side_code == SIDE_LONG:
             return ((current_price - self.entry_price) / self.entry_price) * 100
-        elif self.position_side == "short":
+        elif self.position_side_code == SIDE_SHORT:
             return ((self.entry_price - current_price) / self.entry_price) * 100
         return 0.0
 
@@ -2119,9 +2338,9 @@ class ScalpStrategy(BaseStrategy):
             trail_stop: float | None = self._trail_stop_price if self._trail_stop_price > 0 else None
 
             # Peak P&L (highest/lowest price relative to entry)
-            if self.position_side == "long" and self.entry_price > 0:
+            if self.position_side_code == SIDE_LONG and self.entry_price > 0:
                 peak_pnl = ((self.highest_since_entry - self.entry_price) / self.entry_price) * 100
-            elif self.position_side == "short" and self.entry_price > 0:
+            elif self.position_side_code == SIDE_SHORT and self.entry_price > 0:
                 peak_pnl = ((self.entry_price - self.lowest_since_entry) / self.entry_price) * 100
             else:
                 peak_pnl = 0.0
@@ -2487,6 +2706,13 @@ class ScalpStrategy(BaseStrategy):
         bull_count = breakdown.get("bull_count", 0)
         bear_count = breakdown.get("bear_count", 0)
         mom_dir = "bull" if momentum_60s > 0 else ("bear" if momentum_60s < 0 else "neutral")
+        bull_mask = breakdown.get("bull_mask", 0)
+        bear_mask = breakdown.get("bear_mask", 0)
+
+        def _mask_direction(bit: int) -> str:
+            if bull_mask & bit:
+                return "bull"
+            return "bear" if bear_mask & bit else "neutral"
 
         signals = [
             # Core 4
@@ -2533,54 +2759,42 @@ class ScalpStrategy(BaseStrategy):
                 "value": None,
                 "threshold": None,
                 "firing": breakdown.get("bull_mom", False) or breakdown.get("bear_mom", False),
-                "direction": "bull" if any("TCONT:" in s for s in breakdown.get("bull_signals", [])) else (
-                    "bear" if any("TCONT:" in s for s in breakdown.get("bear_signals", [])) else "neutral"
-                ),
+                "direction": _mask_direction(SIG_TCONT),
             },
             {
                 "signal_id": "VWAP",
                 "value": None,
                 "threshold": None,
-                "firing": any("VWAP:" in s for s in breakdown.get("bull_signals", []) + breakdown.get("bear_signals", [])),
-                "direction": "bull" if any("VWAP:" in s for s in breakdown.get("bull_signals", [])) else (
-                    "bear" if any("VWAP:" in s for s in breakdown.get("bear_signals", [])) else "neutral"
-                ),
+                "firing": bool((bull_mask | bear_mask) & SIG_VWAP),
+                "direction": _mask_direction(SIG_VWAP),
             },
             {
                 "signal_id": "BBSQZ",
                 "value": None,
                 "threshold": None,
-                "firing": any("BBSQZ:" in s for s in breakdown.get("bull_signals", []) + breakdown.get("bear_signals", [])),
-                "direction": "bull" if any("BBSQZ:" in s for s in breakdown.get("bull_signals", [])) else (
-                    "bear" if any("BBSQZ:" in s for s in breakdown.get("bear_signals", [])) else "neutral"
-                ),
+                "firing": bool((bull_mask | bear_mask) & SIG_BBSQZ),
+                "direction": _mask_direction(SIG_BBSQZ),
             },
             {
                 "signal_id": "LIQSWEEP",
                 "value": None,
                 "threshold": None,
-                "firing": any("LIQSWEEP:" in s for s in breakdown.get("bull_signals", []) + breakdown.get("bear_signals", [])),
-                "direction": "bull" if any("LIQSWEEP:" in s for s in breakdown.get("bull_signals", [])) else (
-                    "bear" if any("LIQSWEEP:" in s for s in breakdown.get("bear_signals", [])) else "neutral"
-                ),
+                "firing": False,  # LIQSWEEP disabled — never fires
+                "direction": "neutral",
             },
             {
                 "signal_id": "FVG",
                 "value": None,
                 "threshold": None,
-                "firing": any("FVG:" in s for s in breakdown.get("bull_signals", []) + breakdown.get("bear_signals", [])),
-                "direction": "bull" if any("FVG:" in s for s in breakdown.get("bull_signals", [])) else (
-                    "bear" if any("FVG:" in s for s in breakdown.get("bear_signals", [])) else "neutral"
-                ),
+                "firing": bool((bull_mask | bear_mask) & SIG_FVG),
+                "direction": _mask_direction(SIG_FVG),
             },
             {
                 "signal_id": "VOLDIV",
                 "value": None,
                 "threshold": None,
-                "firing": any("VOLDIV:" in s for s in breakdown.get("bull_signals", []) + breakdown.get("bear_signals", [])),
-                "direction": "bull" if any("VOLDIV:" in s for s in breakdown.get("bull_signals", [])) else (
-                    "bear" if any("VOLDIV:" in s for s in breakdown.get("bear_signals", [])) else "neutral"
-                ),
+                "firing": bool((bull_mask | bear_mask) & SIG_VOLDIV),
+                "direction": _mask_direction(SIG_VOLDIV),
             },
         ]
 
@@ -2631,77 +2845,58 @@ class ScalpStrategy(BaseStrategy):
         )
 
         if side == "long":
-            sl = price * (1 - self._sl_pct / 100)
-            tp = price * (1 + self._tp_pct / 100)
-            return Signal(
-                side="buy",
-                price=price,
-                amount=amount,
-                order_type=order_type,
-                reason=reason,
-                strategy=self.name,
-                pair=self.pair,
-                stop_loss=sl,
-                take_profit=None,  # trailing stop handles exit
-                leverage=self.leverage if self.is_futures else 1,
-                position_type="long" if self.is_futures else "spot",
-                exchange_id="delta" if self.is_futures else "binance",
-                metadata={"pending_side": "long", "pending_amount": amount,
-                          "tp_price": tp, "sl_price": sl,
-                          "sl_pct": self._sl_pct, "tp_pct": self._tp_pct,
-                          "atr_pct": self._last_atr_pct,
-                          "setup_type": setup_type},
+            sl = price * self._sl_mult_long
+            tp = price * self._tp_mult_long
+            md = self._long_meta_template.copy()
+            md["pending_amount"] = amount
+            md["tp_price"] = tp
+            md["sl_price"] = sl
+            md["sl_pct"] = self._sl_pct
+            md["tp_pct"] = self._tp_pct
+            md["atr_pct"] = self._last_atr_pct
+            md["setup_type"] = setup_type
+            return self._long_entry_proto(
+                price=price, amount=amount, order_type=order_type,
+                reason=reason, stop_loss=sl, metadata=md,
             )
         else:  # short
-            sl = price * (1 + self._sl_pct / 100)
-            tp = price * (1 - self._tp_pct / 100)
-            return Signal(
-                side="sell",
-                price=price,
-                amount=amount,
-                order_type=order_type,
-                reason=reason,
-                strategy=self.name,
-                pair=self.pair,
-                stop_loss=sl,
-                take_profit=None,  # trailing stop handles exit
-                leverage=self.leverage,
-                position_type="short",
-                exchange_id="delta",
-                metadata={"pending_side": "short", "pending_amount": amount,
-                          "tp_price": tp, "sl_price": sl,
-                          "sl_pct": self._sl_pct, "tp_pct": self._tp_pct,
-                          "atr_pct": self._last_atr_pct,
-                          "setup_type": setup_type},
+            sl = price * self._sl_mult_short
+            tp = price * self._tp_mult_short
+            md = self._short_meta_template.copy()
+            md["pending_amount"] = amount
+            md["tp_price"] = tp
+            md["sl_price"] = sl
+            md["sl_pct"] = self._sl_pct
+            md["tp_pct"] = self._tp_pct
+            md["atr_pct"] = self._last_atr_pct
+            md["setup_type"] = setup_type
+            return self._short_entry_proto(
+                price=price, amount=amount, order_type=order_type,
+                reason=reason, stop_loss=sl, metadata=md,
             )
 
-    def _exit_signal(self, price: float, side: str, reason: str, peak_pnl: float = 0.0) -> Signal:
+    def _exit_signal(
+        self, price: float, side: str, reason: str,
+        peak_pnl: float = 0.0, amount: float | None = None,
+    ) -> Signal:
         """Build an exit signal for the current position.
 
-        peak_pnl must be pre-computed by the caller BEFORE _record_scalp_result
-        resets entry_price/highest_since_entry/lowest_since_entry.
+        peak_pnl and amount must be captured by the caller BEFORE
+        _record_scalp_result resets entry_amount/entry_price/highest/lowest.
+        amount defaults to the live entry_amount (position still open).
+        Only a position with no known amount is sized from capital.
         """
-        amount = self.entry_amount
+        if amount is None:
+            amount = self.entry_amount
         if amount <= 0:
             exchange_capital = self.risk_manager.get_exchange_capital(self._exchange_id)
             capital = exchange_capital * (self.capital_pct / 100)
-            amount = capital / price
-            if self.is_futures:
-                amount *= self.leverage
+            amount = capital / price * self._exit_leverage
 
-        exit_side = "sell" if side == "long" else "buy"
-        return Signal(
-            side=exit_side,
+        return self._exit_protos[side](
             price=price,
             amount=amount,
-            order_type="market",
             reason=reason,
-            strategy=self.name,
-            pair=self.pair,
-            leverage=self.leverage if self.is_futures else 1,
-            position_type=side if self.is_futures else "spot",
-            reduce_only=self.is_futures,
-            exchange_id="delta" if self.is_futures else "binance",
             metadata={"peak_pnl": round(peak_pnl, 4)},
         )
 
@@ -2711,30 +2906,50 @@ class ScalpStrategy(BaseStrategy):
 
     def on_fill(self, signal: Signal, order: dict) -> None:
         """Called by _run_loop when an order fills."""
-        pending_side = signal.metadata.get("pending_side")
-        pending_amount = signal.metadata.get("pending_amount", 0.0)
-        if pending_side:
-            fill_price = order.get("average") or order.get("price") or signal.price
-            filled_amount = order.get("filled") or pending_amount or signal.amount
-            self._open_position(pending_side, fill_price, filled_amount)
-            soul_msg = _soul_check("momentum")
+        metadata = signal.metadata
+        pending_side = metadata.get("pending_side")
+        if not pending_side:
+            return  # exit signals carry no pending state — booked in _do_exit
+        fill_price = order.get("average") or order.get("price") or signal.price
+        filled_amount = order.get("filled") or metadata.get("pending_amount", 0.0) or signal.amount
+        if pending_side == "long":
+            self._open_long(fill_price, filled_amount)
+        else:
+            self._open_short(fill_price, filled_amount)
+        if self.logger.isEnabledFor(logging.INFO):
             self.logger.info(
                 "[%s] FILLED — %s @ $%.2f, %.6f, %dx | Soul: %s",
                 self.pair, pending_side.upper(), fill_price, filled_amount,
-                self.leverage, soul_msg,
+                self.leverage, _soul_check("momentum"),
             )
 
     def on_rejected(self, signal: Signal) -> None:
         """Called by _run_loop when an order fails."""
         pending_side = signal.metadata.get("pending_side")
-        if pending_side:
-            now = time.monotonic()
-            if now - self._last_reject_log >= 30:
-                self._last_reject_log = now
-                self.logger.warning(
-                    "[%s] REJECTED — NOT tracking %s (phantom prevention)",
-                    self.pair, pending_side,
-                )
+        if pending_side is None:
+            return  # exit signals carry no pending state — nothing to clean up
+        self._reject_count += 1
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        now = time.monotonic()
+        if now - self._last_reject_log >= 30:
+            self._last_reject_log = now
+            self.logger.warning(
+                "[%s] REJECTED — NOT tracking %s (phantom prevention, %d total)",
+                self.pair, pending_side, self._reject_count,
+            )
+
+    def _on_fee_update(self, exchange_id: str, maker: float, taker: float) -> None:
+        """Executor callback — pick up refreshed fee rates for our exchange."""
+        if exchange_id != self._exchange_id:
+            return
+        if exchange_id == "delta":
+            self._entry_fee_rate = maker
+            self._exit_fee_rate = taker
+        else:
+            self._entry_fee_rate = taker
+            self._exit_fee_rate = taker
+        self._round_trip_fee_rate = self._entry_fee_rate + self._exit_fee_rate
 
     # ======================================================================
     # POSITION MANAGEMENT
@@ -2752,13 +2967,32 @@ class ScalpStrategy(BaseStrategy):
         return False
 
     def _open_position(self, side: str, price: float, amount: float = 0.0) -> None:
+        if side == "long":
+            self._open_long(price, amount)
+        else:
+            self._open_short(price, amount)
+
+    def _open_long(self, price: float, amount: float = 0.0) -> None:
+        self._begin_position(price, amount)
+        self.position_side_code = SIDE_LONG
+
+    def _open_short(self, price: float, amount: float = 0.0) -> None:
+        self._begin_position(price, amount)
+        self.position_side_code = SIDE_SHORT
+
+    def _begin_position(self, price: float, amount: float) -> None:
+        """Side-independent entry state — callers set position_side_code."""
         self.in_position = True
-        self.position_side = side
         self.entry_price = price
         self.entry_amount = amount
         self.entry_time = time.monotonic()
         self.highest_since_entry = price
         self.lowest_since_entry = price
+        self._clear_trade_tracking()
+        self._hourly_trades.append(self.entry_time)
+
+    def _clear_trade_tracking(self) -> None:
+        """Reset the exit-tracking state one trade builds up — on open and on close."""
         self._trailing_active = False
         self._trail_stop_price = 0.0              # reset trailing stop price
         self._trail_distance_pct = 0.0             # reset trail distance tier
@@ -2767,36 +3001,29 @@ class ScalpStrategy(BaseStrategy):
         self._in_position_tick = 0  # reset tick counter for OHLCV refresh cadence
         self._mom_flip_since = 0.0  # reset momentum flip confirmation timer
         self._reversal_exit_logged = False  # reset reversal log suppression
-        self._hourly_trades.append(time.time())
 
     def _record_scalp_result(self, pnl_pct: float, exit_type: str) -> None:
-        # Convert contracts to coin amount for correct P&L
-        coin_amount = self.entry_amount
-        if self.is_futures:
-            from alpha.trade_executor import DELTA_CONTRACT_SIZE
-            contract_size = DELTA_CONTRACT_SIZE.get(self.pair, 0.01)
-            coin_amount = self.entry_amount * contract_size
-
-        notional = self.entry_price * coin_amount
-        gross_pnl = notional * (pnl_pct / 100)
-
-        # Fee estimation: maker entry + taker exit (mixed round-trip)
-        # Delta India fees include 18% GST
-        if self._exchange_id == "delta":
-            entry_fee_rate = config.delta.maker_fee_with_gst   # 0.024% (limit entry)
-            exit_fee_rate = config.delta.taker_fee_with_gst    # 0.059% (market exit)
-        else:
-            entry_fee_rate = getattr(self.executor, "_binance_taker_fee", 0.001)
-            exit_fee_rate = entry_fee_rate
-        est_fees = notional * (entry_fee_rate + exit_fee_rate)
-        net_pnl = gross_pnl - est_fees
-
-        capital_pnl_pct = pnl_pct * self.leverage
-
-        self.hourly_pnl += net_pnl
-        self._daily_scalp_loss += net_pnl if net_pnl < 0 else 0
-
-        now = time.monotonic()
+        # Restored positions can carry entry_amount 0 (DB amount unknown) — their
+        # dollar PnL can't be booked, but cooldowns / streaks / history still apply
+        has_amount = self.entry_amount > 0.0
+        if has_amount:
+            # Contracts → coins and fee rates are resolved in __init__ / _on_fee_update
+            notional = self.entry_price * self.entry_amount * self._coin_per_amount
+            gross_pnl = notional * pnl_pct * 0.01
+            est_fees = notional * self._round_trip_fee_rate
+            net_pnl = gross_pnl - est_fees
+
+            self.hourly_pnl += net_pnl
+            self._daily_scalp_loss += net_pnl if net_pnl < 0 else 0
+            n, mu, ssd = self._pnl_agg
+            n += 1
+            delta = net_pnl - mu
+            mu += delta / n
+            ssd += delta * (net_pnl - mu)
+            self._pnl_agg = (n, mu, ssd)
+
+        now_ns = time.monotonic_ns()
+        now = now_ns / _NS_PER_SEC
 
         # Track per-pair win/loss history (for adaptive allocation)
         is_win = pnl_pct >= 0
@@ -2810,6 +3037,9 @@ class ScalpStrategy(BaseStrategy):
 
         if pnl_pct >= 0:
             self.hourly_wins += 1
+            self._win_streak += 1
+            if self._win_streak > self._max_win_streak:
+                self._max_win_streak = self._win_streak
             # Win resets consecutive loss streak for THIS PAIR
             ScalpStrategy._pair_consecutive_losses[self._base_asset] = 0
             ScalpStrategy._pair_post_streak[self._base_asset] = False
@@ -2818,10 +3048,17 @@ class ScalpStrategy(BaseStrategy):
             # Track consecutive losses PER PAIR (BTC losses don't pause XRP)
             prev = ScalpStrategy._pair_consecutive_losses.get(self._base_asset, 0)
             ScalpStrategy._pair_consecutive_losses[self._base_asset] = prev + 1
+            self._win_streak = 0
+            if prev + 1 > self._max_loss_streak:
+                self._max_loss_streak = prev + 1
 
             # SL cooldown: pause THIS PAIR for 2 min after SL
             if exit_type.lower() in ("sl", "ws-sl"):
-                ScalpStrategy._pair_last_sl_time[self._base_asset] = now
+                ScalpStrategy._pair_last_sl_time[self._base_asset] = now_ns
+                ScalpStrategy._pause_horizon_ns = max(
+                    ScalpStrategy._pause_horizon_ns,
+                    now_ns + self.SL_COOLDOWN_SECONDS * _NS_PER_SEC,
+                )
                 self.logger.info(
                     "[%s] SL COOLDOWN SET — no new %s entries for %ds",
                     self.pair, self._base_asset, self.SL_COOLDOWN_SECONDS,
@@ -2830,7 +3067,9 @@ class ScalpStrategy(BaseStrategy):
             # Streak pause: after N consecutive losses on THIS PAIR
             pair_losses = ScalpStrategy._pair_consecutive_losses[self._base_asset]
             if pair_losses >= self.CONSECUTIVE_LOSS_LIMIT:
-                ScalpStrategy._pair_streak_pause_until[self._base_asset] = now + self.STREAK_PAUSE_SECONDS
+                pause_until_ns = now_ns + self.STREAK_PAUSE_SECONDS * _NS_PER_SEC
+                ScalpStrategy._pair_streak_pause_until[self._base_asset] = pause_until_ns
+                ScalpStrategy._pause_horizon_ns = max(ScalpStrategy._pause_horizon_ns, pause_until_ns)
                 ScalpStrategy._pair_post_streak[self._base_asset] = True  # first trade back needs 3/4
                 self.logger.warning(
                     "[%s] STREAK PAUSE — %d consecutive %s losses! Pausing %s for %ds",
@@ -2841,39 +3080,41 @@ class ScalpStrategy(BaseStrategy):
         # Reversal cooldown: block same-direction re-entry for 3 min (move is dead)
         if exit_type.upper() == "REVERSAL":
             exited_side = self.position_side or "long"
-            ScalpStrategy._pair_last_reversal_time[self._base_asset] = now
+            ScalpStrategy._pair_last_reversal_time[self._base_asset] = now_ns
             ScalpStrategy._pair_last_reversal_side[self._base_asset] = exited_side
             self.logger.info(
                 "[%s] REVERSAL COOLDOWN SET — no %s re-entry on %s for %ds",
                 self.pair, exited_side, self._base_asset, self.REVERSAL_COOLDOWN_SECONDS,
             )
 
-        hold_sec = int(now - self.entry_time)
-        duration = f"{hold_sec // 60}m{hold_sec % 60:02d}s" if hold_sec >= 60 else f"{hold_sec}s"
+        # Log with fee breakdown for visibility — all of it skipped when INFO is off
+        if not has_amount:
+            self.logger.info(
+                "[%s] CLOSED %s %+.2f%% price with no entry amount — PnL not booked",
+                self.pair, exit_type.upper(), pnl_pct,
+            )
+        elif self.logger.isEnabledFor(logging.INFO):
+            hold_sec = int(now - self.entry_time)
+            fee_ratio = abs(gross_pnl / est_fees) if est_fees > 0 else 0
+            pair_losses = ScalpStrategy._pair_consecutive_losses.get(self._base_asset, 0)
+            self.logger.info(
+                "[%s] CLOSED %s %+.2f%% price (%+.1f%% capital at %dx) | "
+                "Gross=$%.4f Net=$%.4f fees=$%.4f (%.1fx) | %s | W/L=%d/%d%s",
+                self.pair, exit_type.upper(), pnl_pct, pnl_pct * self.leverage, self.leverage,
+                gross_pnl, net_pnl, est_fees, fee_ratio, _format_hold(hold_sec),
+                self.hourly_wins, self.hourly_losses,
+                f" streak={pair_losses}" if pair_losses > 0 else "",
+            )
 
-        # Log with fee breakdown for visibility
-        fee_ratio = abs(gross_pnl / est_fees) if est_fees > 0 else 0
-        pair_losses = ScalpStrategy._pair_consecutive_losses.get(self._base_asset, 0)
-        streak_tag = f" streak={pair_losses}" if pair_losses > 0 else ""
-        self.logger.info(
-            "[%s] CLOSED %s %+.2f%% price (%+.1f%% capital at %dx) | "
-            "Gross=$%.4f Net=$%.4f fees=$%.4f (%.1fx) | %s | W/L=%d/%d%s",
-            self.pair, exit_type.upper(), pnl_pct, capital_pnl_pct, self.leverage,
-            gross_pnl, net_pnl, est_fees, fee_ratio, duration,
-            self.hourly_wins, self.hourly_losses, streak_tag,
-        )
+        self._reset_position_state(now)
 
+    def _reset_position_state(self, now: float) -> None:
+        """Clear all per-position state after a close."""
         self.in_position = False
-        self.position_side = None
+        self.position_side_code = SIDE_NONE
         self.entry_price = 0.0
         self.entry_amount = 0.0
-        self._trailing_active = False
-        self._trail_stop_price = 0.0
-        self._trail_distance_pct = 0.0
-        self._peak_unrealized_pnl = 0.0  # reset for next trade
-        self._profit_floor_pct = -999.0  # reset ratcheting profit floor
-        self._in_position_tick = 0  # reset tick counter
-        self._reversal_exit_logged = False
+        self._clear_trade_tracking()
         self._last_position_exit = now
         ScalpStrategy._live_pnl.pop(self.pair, None)  # clean up live P&L tracker
 
@@ -2882,14 +3123,27 @@ class ScalpStrategy(BaseStrategy):
     # ======================================================================
 
     def reset_hourly_stats(self) -> dict[str, Any]:
-        stats = {
-            "pair": self.pair,
-            "wins": self.hourly_wins,
-            "losses": self.hourly_losses,
-            "pnl": self.hourly_pnl,
-            "trades": self.hourly_wins + self.hourly_losses,
-            "skipped": self.hourly_skipped,
-        }
+        buf = self._hourly_stats_buf
+        buf["wins"] = self.hourly_wins
+        buf["losses"] = self.hourly_losses
+        buf["pnl"] = self.hourly_pnl
+        buf["trades"] = self.hourly_wins + self.hourly_losses
+        buf["skipped"] = self.hourly_skipped
+        n, mu, ssd = _pnl_agg_merge(
+            self._pnl_agg_hour_carry, _pnl_agg_since(self._pnl_agg, self._pnl_agg_hour_start),
+        )
+        self._pnl_agg_hour_carry = _EMPTY_PNL_AGG
+        buf["pnl_mean"] = mu
+        buf["pnl_variance"] = ssd / (n - 1) if n > 1 else 0.0
+        self._pnl_agg_hour_start = self._pnl_agg
+        # Day-to-date window straight off the running aggregate — no separate tally
+        n, mu, ssd = self._pnl_agg
+        buf["day_trades"] = n
+        buf["day_pnl"] = n * mu
+        buf["day_pnl_variance"] = ssd / (n - 1) if n > 1 else 0.0
+        buf["max_win_streak"] = self._max_win_streak
+        buf["max_loss_streak"] = self._max_loss_streak
+        stats = buf.copy()
         self.hourly_wins = 0
         self.hourly_losses = 0
         self.hourly_pnl = 0.0
@@ -2898,3 +3152,12 @@ class ScalpStrategy(BaseStrategy):
 
     def reset_daily_stats(self) -> None:
         self._daily_scalp_loss = 0.0
+        # Rebase the hour window: trades already in it move to the carry so the
+        # next hourly stats still include them once the day aggregate restarts
+        self._pnl_agg_hour_carry = _pnl_agg_merge(
+            self._pnl_agg_hour_carry, _pnl_agg_since(self._pnl_agg, self._pnl_agg_hour_start),
+        )
+        self._pnl_agg = _EMPTY_PNL_AGG
+        self._pnl_agg_hour_start = _EMPTY_PNL_AGG
+        self._max_win_streak = 0
+        self._max_loss_streak = 0
@@ -10,7 +10,8 @@ import asyncio
 import math
 import re
 import time
-from typing import Any
+import weakref
+from typing import Any, Callable
 
 import ccxt.async_support as ccxt
 
@@ -189,6 +190,33 @@ class TradeExecutor:
         self._delta_taker_fee: float = config.delta.taker_fee_with_gst  # 0.059% per side
         self._delta_maker_fee: float = config.delta.maker_fee_with_gst  # 0.024% per side
         self._binance_taker_fee: float = 0.001  # default 0.1%
+        # Notified with (exchange_id, maker_fee, taker_fee) whenever fee rates refresh.
+        # Held weakly so a dropped / recreated strategy is not kept alive by the executor.
+        self._fee_listeners: list[weakref.WeakMethod[Callable[[str, float, float], None]]] = []
+
+    def on_fee_update(self, callback: Callable[[str, float, float], None]) -> None:
+        """Register a bound-method callback fired when per-side fee rates are refreshed.
+
+        The callback is invoked right away with the current rates, so a listener
+        registered after load_market_limits() still starts from the API rates.
+        """
+        self._fee_listeners = [ref for ref in self._fee_listeners if ref() is not None]
+        self._fee_listeners.append(weakref.WeakMethod(callback))
+        callback("delta", self._delta_maker_fee, self._delta_taker_fee)
+        callback("binance", self._binance_taker_fee, self._binance_taker_fee)
+
+    def _notify_fee_update(self, exchange_id: str, maker: float, taker: float) -> None:
+        live = []
+        for ref in self._fee_listeners:
+            callback = ref()
+            if callback is None:
+                continue  # owner was garbage-collected
+            live.append(ref)
+            try:
+                callback(exchange_id, maker, taker)
+            except Exception:
+                logger.exception("Fee update listener failed for %s", exchange_id)
+        self._fee_listeners = live
 
     @staticmethod
     def _is_option_symbol(pair: str) -> bool:
@@ -207,6 +235,50 @@ class TradeExecutor:
             return self.delta_exchange
         return self.exchange  # default: Binance
 
+    async def batch_fetch_ohlcv(
+        self,
+        pairs: list[str],
+        timeframe: str,
+        limit: int,
+        exchange: ccxt.Exchange | None = None,
+    ) -> dict[str, list | Exception]:
+        """Fetch OHLCV for several pairs on one exchange concurrently.
+
+        Neither venue has a multi-symbol klines endpoint, so this fans out one
+        request per pair over the shared ccxt session (its rate limiter paces
+        them). A failed pair maps to its exception instead of failing the batch.
+        """
+        ex = exchange or self.exchange
+        results = await asyncio.gather(
+            *(ex.fetch_ohlcv(pair, timeframe, limit=limit) for pair in pairs),
+            return_exceptions=True,
+        )
+        return dict(zip(pairs, results))
+
+    async def batch_fetch_tickers(
+        self,
+        pairs: list[str],
+        exchange: ccxt.Exchange | None = None,
+    ) -> dict[str, dict | Exception]:
+        """Fetch tickers for several pairs — one fetch_tickers call where supported.
+
+        A failed pair maps to its exception instead of failing the batch.
+        """
+        ex = exchange or self.exchange
+        if len(pairs) > 1 and ex.has.get("fetchTickers"):
+            try:
+                tickers = await ex.fetch_tickers(pairs)
+            except Exception as e:
+                return {pair: e for pair in pairs}
+            return {
+                pair: tickers[pair] if pair in tickers else LookupError(f"no ticker for {pair}")
+                for pair in pairs
+            }
+        results = await asyncio.gather(
+            *(ex.fetch_ticker(pair) for pair in pairs), return_exceptions=True,
+        )
+        return dict(zip(pairs, results))
+
     @staticmethod
     def _to_delta_contracts(pair: str, coin_amount: float, price: float) -> int:
         """Convert a fractional coin amount to integer Delta Exchange contracts.
@@ -431,6 +503,7 @@ class TradeExecutor:
                     self._delta_taker_fee * 200, self._delta_maker_fee * 200,
                     (self._delta_maker_fee + self._delta_taker_fee) * 100,
                 )
+                self._notify_fee_update("delta", self._delta_maker_fee, self._delta_taker_fee)
             except Exception:
                 logger.exception("Failed to load Delta market limits")
 
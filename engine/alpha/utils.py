@@ -2,13 +2,35 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime, timezone, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
 
+# All loggers share one console writer on a background thread. Handlers on the
+# event loop only enqueue the record, so a slow stdout / journald pipe never
+# stalls a tick or an order.
+_log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+_log_listener: QueueListener | None = None
+
+
+def _start_log_listener() -> None:
+    global _log_listener
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter(
+        "[%(asctime)s] %(levelname)-8s %(name)-20s │ %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    ))
+    _log_listener = QueueListener(_log_queue, console)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)  # drain queued lines on shutdown
+
+
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     """Create a logger with console + standardised format."""
     logger = logging.getLogger(name)
@@ -16,13 +38,10 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
         return logger
     logger.setLevel(level)
 
-    handler = logging.StreamHandler(sys.stdout)
+    if _log_listener is None:
+        _start_log_listener()
+    handler = QueueHandler(_log_queue)
     handler.setLevel(level)
-    fmt = logging.Formatter(
-        "[%(asctime)s] %(levelname)-8s %(name)-20s │ %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-    handler.setFormatter(fmt)
     logger.addHandler(handler)
     return logger
 